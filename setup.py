@@ -34,12 +34,13 @@ setup(
         "sqlalchemy-utils",
         "sqlalchemy-json",
         "python-dotenv",
-        "pytz",
     ],
     extras_require={
-        "all": ["mysql-connector-python", "pg8000"],
+        "all": ["mysql-connector-python", "psycopg[binary]"],
         "mysql": ["mysql-connector-python"],
-        "postgresql": ["pg8000"],
+        "postgresql": ["psycopg[binary]"],
+        "async": ["sqlalchemy[asyncio]", "aiomysql", "asyncpg", "aiosqlite"],
+        "json": ["orjson"],
         "test": ["pytest", "pytest-cov"],
     },
 )
@@ -1,5 +1,5 @@
 from .model import BaseModel, BaseArchived, BaseID, BaseUUID
-from .controller import Controller
+from .controller import Controller, PaginationError
 
 # from .dao import Dao  # Removed to prevent external access
 from .connection import get_engine, test_conn
@@ -10,6 +10,7 @@ __all__ = [
     "BaseID",
     "BaseUUID",
     "Controller",
+    "PaginationError",
     # "Dao",  # Removed from exports
     "get_engine",
     "test_conn",
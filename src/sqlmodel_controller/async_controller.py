@@ -0,0 +1,206 @@
+from functools import cached_property
+from typing import Any, Generic, List, Mapping, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from .connection import get_async_engine
+from .controller import (
+    DEFAULT_BATCH_SIZE,
+    Controller,
+    ModelClass,
+    _current_session,
+    compiled_cache,
+    invalidate_results,
+)
+
+
+class AsyncController(Generic[ModelClass]):
+    """
+    An asyncio counterpart of `Controller`, for use with an `AsyncEngine`.
+
+    Each call awaits its database round-trips instead of blocking the thread,
+    so many calls can run concurrently on one event loop. The statements are
+    built and the rows serialized by a `Controller` running inside
+    `AsyncSession.run_sync`, so both controllers return the same results.
+
+    Attributes:
+        engine (AsyncEngine): The SQLAlchemy asyncio engine to use for database connections.
+        strict_loading (Optional[bool]): Passed to the underlying `Controller`.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine] = None,
+        strict_loading: Optional[bool] = None,
+    ):
+        """
+        Initializes the AsyncController with an asyncio database engine.
+
+        Args:
+            engine (Optional[AsyncEngine], optional): The engine to use. If not provided,
+                it will be obtained using get_async_engine().
+            strict_loading (Optional[bool], optional): Make relationships that were not
+                requested in `joins` raise on access instead of lazy loading them.
+        """
+        self.engine = engine or get_async_engine()
+        self.strict_loading = strict_loading
+        self._Session = async_sessionmaker(
+            self.engine.execution_options(compiled_cache=compiled_cache),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    @cached_property
+    def model_class(self) -> type[ModelClass]:
+        """
+        Returns the SQLModel class associated with this controller.
+
+        Returns:
+            type[ModelClass]: The SQLModel class.
+        """
+        return self.__orig_class__.__args__[0]
+
+    @cached_property
+    def _controller_class(self):
+        return Controller[self.model_class]
+
+    async def _run(self, method: str, *args, **kwargs):
+        """
+        Runs a `Controller` method on a new AsyncSession and commits it.
+
+        A new `Controller` is used per call, since controllers keep their session
+        on the instance and concurrent calls must not share it.
+
+        Args:
+            method (str): The name of the `Controller` method to run.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            The result of the method.
+        """
+        controller = self._controller_class(
+            engine=self.engine.sync_engine, strict_loading=self.strict_loading
+        )
+
+        def call(session: Session):
+            # The controller joins `session` like a unit of work: it only flushes
+            token = _current_session.set((controller.engine, session))
+            try:
+                return getattr(controller, method)(*args, **kwargs)
+            finally:
+                _current_session.reset(token)
+
+        async with self._Session() as session:
+            result = await session.run_sync(call)
+            await session.commit()
+            for model_class in session.sync_session.info.pop("written_models", ()):
+                invalidate_results(model_class)
+        return result
+
+    async def get(
+        self,
+        by: str | List[str],
+        value: Any | List[Any],
+        joins: Optional[List[str]] = None,
+    ):
+        """
+        Retrieves a single record from the database. See `Controller.get`.
+        """
+        return await self._run("get", by, value, joins=joins)
+
+    async def get_many(
+        self,
+        by: str,
+        values: List[Any],
+        joins: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Retrieves the records matching any of the given values. See `Controller.get_many`.
+        """
+        return await self._run("get_many", by, values, joins=joins)
+
+    async def list(
+        self,
+        filter: Optional[Mapping[str, Any]] = None,
+        order: Optional[Mapping[str, str]] = None,
+        joins: Sequence = (),
+        **kwargs,
+    ):
+        """
+        Retrieves a list of records from the database. See `Controller.list`.
+
+        Raises:
+            ValueError: If `mode="stream"` is requested, which needs a synchronous session.
+        """
+        if kwargs.get("mode") == "stream":
+            raise ValueError('mode="stream" is not supported by AsyncController')
+        return await self._run("list", filter, order, joins, **kwargs)
+
+    async def create(self, data: dict, returns_object: bool = False) -> int | dict:
+        """
+        Creates a new record in the database. See `Controller.create`.
+        """
+        return await self._run("create", data, returns_object=returns_object)
+
+    async def create_many(
+        self, data: List[dict], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[int]:
+        """
+        Creates several records in one transaction. See `Controller.create_many`.
+        """
+        return await self._run("create_many", data, batch_size=batch_size)
+
+    async def update(
+        self,
+        by: str | List[str],
+        value: Any | List[Any],
+        data: dict,
+        returns_object: bool = False,
+    ):
+        """
+        Updates an existing record in the database. See `Controller.update`.
+        """
+        return await self._run(
+            "update", by, value, data, returns_object=returns_object
+        )
+
+    async def update_bulk(
+        self, by: str | List[str], value: Any | List[Any], data: dict
+    ) -> int:
+        """
+        Updates every record matching the selector in one UPDATE. See `Controller.update_bulk`.
+        """
+        return await self._run("update_bulk", by, value, data)
+
+    async def update_many(self, data: List[dict]):
+        """
+        Updates several records by primary key. See `Controller.update_many`.
+        """
+        return await self._run("update_many", data)
+
+    async def upsert(
+        self,
+        by: Optional[str] = None,
+        value: Optional[Any] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        returns_object: bool = False,
+    ) -> int | dict:
+        """
+        Inserts a new record or updates an existing one. See `Controller.upsert`.
+        """
+        return await self._run(
+            "upsert", by, value, data, returns_object=returns_object
+        )
+
+    async def archive(self, by: str | List[str], value: Any | List[Any]):
+        """
+        Archives (soft deletes) a record or records. See `Controller.archive`.
+        """
+        return await self._run("archive", by, value)
+
+    async def delete(self, by: str | List[str], value: Any | List[Any]):
+        """
+        Deletes a record or records from the database. See `Controller.delete`.
+        """
+        return await self._run("delete", by, value)
@@ -1,10 +1,12 @@
 import os, logging
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
+from sqlalchemy import text
 from sqlmodel import create_engine
-import sqlite3
-from ssl import create_default_context
 
 
+@lru_cache(maxsize=1)
 def get_db_config():
     load_dotenv()
     return {
@@ -17,55 +19,135 @@ def get_db_config():
     }
 
 
-def get_engine():
+def _env_int(name: str, value: Optional[int], default: int) -> int:
+    if value is not None:
+        return value
+    return int(os.environ.get(name, default))
+
+
+def get_engine(
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_recycle: int = 60,
+    pool_pre_ping: bool = False,
+):
+    """
+    Returns the engine for the configured database.
+
+    Engines are cached per configuration and pool settings, so every caller
+    shares one connection pool instead of opening a new one per Controller.
+    Set `pool_pre_ping=False` (the default) when connecting through PgBouncer
+    or another pooler that already validates connections.
+
+    Args:
+        pool_size (Optional[int], optional): Connections kept open in the pool.
+            Defaults to the DB_POOL_SIZE environment variable, or 10.
+        max_overflow (Optional[int], optional): Extra connections allowed above
+            `pool_size`. Defaults to the DB_MAX_OVERFLOW environment variable, or 5.
+        pool_recycle (int, optional): Seconds after which a connection is recycled.
+        pool_pre_ping (bool, optional): Test connections with a ping on checkout.
+
+    Returns:
+        Engine: The shared SQLAlchemy engine.
+    """
     config = get_db_config()
+    pool_size = _env_int("DB_POOL_SIZE", pool_size, 10)
+    max_overflow = _env_int("DB_MAX_OVERFLOW", max_overflow, 5)
+    return _create_engine(
+        tuple(config.items()), pool_size, max_overflow, pool_recycle, pool_pre_ping
+    )
+
+
+@lru_cache(maxsize=None)
+def _create_engine(config_items, pool_size, max_overflow, pool_recycle, pool_pre_ping):
+    config = dict(config_items)
     if config["type"] == "mysql":
         db_uri = f"mysql+mysqlconnector://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['name']}"
     elif config["type"] == "sqlite":
         db_uri = f"sqlite:///{config['name']}.db"
     elif config["type"] == "postgres":
 
-        db_uri = f"postgresql+pg8000://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['name']}"
+        db_uri = f"postgresql+psycopg://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['name']}"
     else:
         raise ValueError(f"Unsupported database type: {config['type']}")
-    return create_engine(db_uri)
+    return create_engine(
+        db_uri,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
 
 
-def test_conn():
+def get_async_engine(
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_recycle: int = 60,
+    pool_pre_ping: bool = False,
+):
+    """
+    Returns the asyncio engine for the configured database, for `AsyncController`.
+
+    Uses aiomysql, asyncpg or aiosqlite as the driver, which must be installed
+    together with `sqlalchemy[asyncio]`. Engines are cached like `get_engine`.
+
+    Args:
+        pool_size (Optional[int], optional): Connections kept open in the pool.
+            Defaults to the DB_POOL_SIZE environment variable, or 10.
+        max_overflow (Optional[int], optional): Extra connections allowed above
+            `pool_size`. Defaults to the DB_MAX_OVERFLOW environment variable, or 5.
+        pool_recycle (int, optional): Seconds after which a connection is recycled.
+        pool_pre_ping (bool, optional): Test connections with a ping on checkout.
+
+    Returns:
+        AsyncEngine: The shared SQLAlchemy asyncio engine.
+    """
     config = get_db_config()
+    pool_size = _env_int("DB_POOL_SIZE", pool_size, 10)
+    max_overflow = _env_int("DB_MAX_OVERFLOW", max_overflow, 5)
+    return _create_async_engine(
+        tuple(config.items()), pool_size, max_overflow, pool_recycle, pool_pre_ping
+    )
+
+
+@lru_cache(maxsize=None)
+def _create_async_engine(
+    config_items, pool_size, max_overflow, pool_recycle, pool_pre_ping
+):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    config = dict(config_items)
+    if config["type"] == "mysql":
+        db_uri = f"mysql+aiomysql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['name']}"
+    elif config["type"] == "sqlite":
+        db_uri = f"sqlite+aiosqlite:///{config['name']}.db"
+    elif config["type"] == "postgres":
+        db_uri = f"postgresql+asyncpg://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['name']}"
+    else:
+        raise ValueError(f"Unsupported database type: {config['type']}")
+    return create_async_engine(
+        db_uri,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
+
+def test_conn():
+    """
+    Checks that the configured database is reachable.
+
+    Runs `SELECT 1` through the shared engine, so the check exercises the same
+    driver and connection pool the controllers use.
+
+    Returns:
+        bool: True if the query succeeded, False otherwise.
+    """
     try:
-        if config["type"] == "mysql":
-            import mysql.connector
-
-            conn = mysql.connector.connect(
-                host=config["host"],
-                user=config["user"],
-                password=config["password"],
-                database=config["name"],
-            )
-        elif config["type"] == "sqlite":
-            conn = sqlite3.connect(f"{config['name']}.db")
-        elif config["type"] == "postgres":
-            from pg8000.native import Connection as PgConnection
-            from pg8000.exceptions import DatabaseError, InterfaceError
-
-            ssl_context = create_default_context()
-            conn = PgConnection(
-                user=config["user"],
-                password=config["password"],
-                host=config["host"],
-                port=int(config["port"]),
-                database=config["name"],
-                ssl_context=ssl_context,
-            )
-        else:
-            raise ValueError(f"Unsupported database type: {config['type']}")
-
-        conn.close()
+        with get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
         return True
-    except (DatabaseError, InterfaceError) as e:
-        logging.error(f"PostgreSQL connection error: {str(e)}")
-        return False
     except Exception as e:
         logging.error(f"Connection test failed: {str(e)}")
         return False
@@ -1,29 +1,105 @@
-from typing import Any, Optional, List, TypeVar, Generic
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from itertools import repeat
+from operator import methodcaller
+from typing import Any, Mapping, Optional, List, Sequence, TypedDict, TypeVar, Generic
 from .connection import get_engine
+from sqlalchemy import Table, inspect, text, tuple_
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.util import find_tables
+from sqlalchemy.util import LRUCache
 from sqlmodel import Session, SQLModel
-import math
-from pydantic import BaseModel
-from .dao import Dao
+from .dao import (
+    Dao,
+    column_map,
+    compiled_get,
+    compiled_get_many,
+    load_options,
+    primary_key_names,
+    unique_keys,
+    value_parsers,
+)
+from .model import BaseModel, make_serializer
 from sqlmodel import select, func
 from sqlalchemy.exc import SQLAlchemyError
 
 
 DEFAULT_PAGE = 1
 DEFAULT_PER_PAGE = 25
+DEFAULT_BATCH_SIZE = 1000
+COUNT_CACHE_SIZE = 1024
+RESULT_CACHE_SIZE = 4096
+COMPILED_CACHE_SIZE = 2048
 
+# Default for `Controller(strict_loading=...)`; set SQLMODEL_CONTROLLER_STRICT=1
+# in development to make lazy loads of relationships outside `joins` raise.
+STRICT_LOADING = os.environ.get("SQLMODEL_CONTROLLER_STRICT") == "1"
 
-class Page(BaseModel):
+# Compiled SQL shared by every controller; keys include the dialect, so one
+# cache can serve several engines.
+compiled_cache = LRUCache(COMPILED_CACHE_SIZE)
+
+_count_cache: dict = {}
+
+# Bumped per table on every write, and part of the count cache keys, so
+# writes make the cached totals of their tables unreachable.
+_count_versions: dict = {}
+
+# Results of `get`/`list` for controllers created with `result_cache_ttl`,
+# grouped by model class so writes can drop a whole model at once.
+_result_cache: dict = {}
+
+# Bumped on every invalidation, so a read that started before a write does
+# not store its (possibly stale) result afterwards.
+_result_generation: dict = {}
+
+# The (engine, session) of the innermost unit of work running in this context,
+# shared by every controller on that engine.
+_current_session: ContextVar[Optional[tuple]] = ContextVar(
+    "sqlmodel_controller_session", default=None
+)
+
+
+class PaginationError(ValueError):
+    """
+    Raised when pagination is requested with an invalid page or page size.
+    """
+
+
+class PageDict(TypedDict):
+    """
+    The dictionary returned by `paginate` (and `Controller.list(mode="paginated")`).
+    """
+
+    data_set: List[Any]
+    current: int
+    per_page: int
+    total_pages: Optional[int]
+    total_data: Optional[int]
+    previous: Optional[int]
+    next: Optional[int]
+
+
+@dataclass(slots=True, frozen=True)
+class Page:
     """
     Represents a page of data in a paginated result set.
 
+    A plain slotted, immutable dataclass: the values are computed internally,
+    so there is nothing for pydantic validation to check.
+
     Attributes:
         data_set (List[Any]): The list of items on the current page.
         previous_page (Optional[int]): The number of the previous page, if it exists.
         next_page (Optional[int]): The number of the next page, if it exists.
         has_previous (bool): Indicates whether there is a previous page.
         has_next (bool): Indicates whether there is a next page.
-        total (int): The total number of items across all pages.
-        pages (int): The total number of pages.
+        total (Optional[int]): The total number of items across all pages, if counted.
+        pages (Optional[int]): The total number of pages, if counted.
     """
 
     data_set: List[Any]
@@ -31,11 +107,18 @@ class Page(BaseModel):
     next_page: Optional[int]
     has_previous: bool
     has_next: bool
-    total: int
-    pages: int
+    total: Optional[int]
+    pages: Optional[int]
 
     @classmethod
-    def create(cls, data_set: List[Any], page: int, page_size: int, total: int):
+    def create(
+        cls,
+        data_set: List[Any],
+        page: int,
+        page_size: int,
+        total: Optional[int],
+        has_next: Optional[bool] = None,
+    ):
         """
         Creates a Page instance with calculated pagination information.
 
@@ -43,25 +126,190 @@ class Page(BaseModel):
             data_set (List[Any]): The list of items on the current page.
             page (int): The current page number.
             page_size (int): The number of items per page.
-            total (int): The total number of items across all pages.
+            total (Optional[int]): The total number of items across all pages, or None
+                if it was not counted.
+            has_next (Optional[bool], optional): Whether a next page exists, when
+                already known. Derived from `total` when omitted.
 
         Returns:
             Page: A Page instance with calculated pagination information.
         """
+        has_previous = page > 1
+        if has_next is None and total is not None:
+            has_next = (page - 1) * page_size + len(data_set) < total
         return cls(
             data_set=data_set,
-            previous_page=page - 1 if page > 1 else None,
-            next_page=(
-                page + 1 if (page - 1) * page_size + len(data_set) < total else None
-            ),
-            has_previous=page > 1,
-            has_next=(page - 1) * page_size + len(data_set) < total,
+            previous_page=page - 1 if has_previous else None,
+            next_page=page + 1 if has_next else None,
+            has_previous=has_previous,
+            has_next=bool(has_next),
             total=total,
-            pages=int(math.ceil(total / float(page_size))),
+            pages=-(-total // page_size) if total is not None else None,
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Returns the page fields as a dictionary, like pydantic's `.dict()` did.
+
+        The rows in `data_set` are not copied or converted.
+
+        Returns:
+            dict: The page fields keyed by name.
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def count_query(query):
+    """
+    Derives the COUNT statement for a paginated query.
+
+    The count reuses the query's FROM and WHERE clauses directly, dropping the
+    ORDER BY and the eager-load options, instead of wrapping the whole query in
+    a subquery. Queries using DISTINCT or GROUP BY still count over a subquery,
+    since their row count depends on those clauses.
+
+    Args:
+        query: The SQLAlchemy query to count.
+
+    Returns:
+        A select statement returning the number of rows matched by `query`.
+    """
+    if query._distinct or query._group_by_clauses:
+        return select(func.count()).select_from(query.order_by(None).subquery())
+    return query.with_only_columns(func.count(), maintain_column_froms=True).order_by(
+        None
+    )
+
+
+def count_total(query, session: Session, ttl: Optional[float] = None) -> int:
+    """
+    Counts the rows matched by a query, optionally memoizing the result.
+
+    Args:
+        query: The SQLAlchemy query to count.
+        session (Session): The SQLAlchemy session.
+        ttl (Optional[float], optional): Seconds to reuse a previous count for the
+            same statement and parameters. Counts are not cached when omitted.
+
+    Returns:
+        int: The number of rows matched by `query`.
+    """
+    statement = count_query(query)
+    if not ttl:
+        return session.exec(statement).one()
+
+    bind = session.get_bind()
+    compiled = statement.compile(dialect=bind.dialect)
+    versions = tuple(_count_versions.get(t, 0) for t in find_tables(statement))
+    # Controllers bind their sessions to per-instance option engines that share
+    # the pool of the engine they wrap, so the pool identifies the database
+    key = (bind.pool, str(compiled), repr(sorted(compiled.params.items())), versions)
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    total = session.exec(statement).one()
+    if len(_count_cache) >= COUNT_CACHE_SIZE:
+        _count_cache.pop(next(iter(_count_cache)))
+    _count_cache[key] = (total, now + ttl)
+    return total
+
+
+def estimate_total(query, session: Session) -> Optional[int]:
+    """
+    Reads the database's own row estimate for the table `query` selects from.
+
+    The estimate comes from table statistics (`pg_class.reltuples` on PostgreSQL,
+    `information_schema.TABLES` on MySQL), so it costs no scan but can be off
+    by the rows written since the table was last analyzed. It only describes
+    the whole table, so filtered queries get no estimate.
+
+    Args:
+        query: The SQLAlchemy query to estimate.
+        session (Session): The SQLAlchemy session.
+
+    Returns:
+        Optional[int]: The estimated number of rows, or None when the query is
+        filtered, selects from more than one table, or the database has no
+        estimate.
+    """
+    froms = query.get_final_froms()
+    if query.whereclause is not None or len(froms) != 1:
+        return None
+    table = froms[0]
+    if not isinstance(table, Table):
+        return None
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+        )
+        params = {"table": table.fullname}
+    elif dialect in ("mysql", "mariadb"):
+        statement = text(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES"
+            " WHERE TABLE_SCHEMA = COALESCE(:schema, DATABASE())"
+            " AND TABLE_NAME = :table"
         )
+        params = {"schema": table.schema, "table": table.name}
+    else:
+        return None
+    estimate = session.execute(statement, params).scalar()
+    # PostgreSQL reports -1 for tables that were never analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
 
 
-def paginate(query, session: Session, current_page: int, per_page: int):
+def invalidate_results(model_class: type[SQLModel]):
+    """
+    Drops the cached `get`/`list` results and paginated totals of a model class.
+
+    Controllers call it after committing writes to the model; call it yourself
+    after changing the table outside the controllers.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class whose results are dropped.
+    """
+    _result_generation[model_class] = _result_generation.get(model_class, 0) + 1
+    _result_cache.pop(model_class, None)
+    table = getattr(model_class, "__table__", None)
+    if table is not None:
+        _count_versions[table] = _count_versions.get(table, 0) + 1
+
+
+def window_count_supported(dialect) -> bool:
+    """
+    Tells whether `COUNT(*) OVER ()` can return the total alongside the page rows.
+
+    Args:
+        dialect: The SQLAlchemy dialect of the session's bind.
+
+    Returns:
+        bool: True for PostgreSQL, SQLite 3.25+, MySQL 8+ and MariaDB 10.2+.
+    """
+    version = dialect.server_version_info or ()
+    if dialect.name == "postgresql":
+        return True
+    if dialect.name == "sqlite":
+        return version >= (3, 25)
+    if dialect.name in ("mysql", "mariadb"):
+        if getattr(dialect, "is_mariadb", False):
+            return version >= (10, 2)
+        return version >= (8,)
+    return False
+
+
+def paginate(
+    query,
+    session: Session,
+    current_page: int,
+    per_page: int,
+    count_cache_ttl: Optional[float] = None,
+    to_dict: bool = True,
+    include_total: bool | str = True,
+) -> PageDict | Page:
     """
     Paginates a query result.
 
@@ -70,35 +318,222 @@ def paginate(query, session: Session, current_page: int, per_page: int):
         session (Session): The SQLAlchemy session.
         current_page (int): The current page number.
         per_page (int): The number of items per page.
+        count_cache_ttl (Optional[float], optional): Seconds to reuse the total count
+            for repeated queries with the same filters. Defaults to no caching.
         to_dict (bool, optional): Whether to return the result as a dictionary. Defaults to True.
+        include_total (bool | str, optional): Whether to count the rows of the whole query.
+            When False, one extra row is fetched to tell whether a next page exists,
+            no COUNT is issued and the totals are None. When "estimate", the totals
+            of unfiltered queries come from `estimate_total`, falling back to an
+            exact count. Defaults to True.
 
     Returns:
-        Union[dict, Page]: A dictionary or Page object containing the paginated results and metadata.
+        Union[PageDict, Page]: A dictionary or Page object containing the paginated results and metadata.
 
     Raises:
-        ValueError: If current_page or per_page is less than 1.
+        PaginationError: If current_page or per_page is less than 1.
     """
     if current_page < 1:
-        raise ValueError("Page needs to be >= 1")
+        raise PaginationError("Page needs to be >= 1")
     if per_page < 1:
-        raise ValueError("The page size needs to be >= 1")
+        raise PaginationError("The page size needs to be >= 1")
 
     offset = (current_page - 1) * per_page
-    data_set = session.exec(query.offset(offset).limit(per_page)).all()
-    total = session.exec(select(func.count()).select_from(query.subquery())).one()
-    page_data = Page.create(data_set, current_page, per_page, total)
+    total = estimate_total(query, session) if include_total == "estimate" else None
+    if not include_total:
+        data_set = session.exec(query.offset(offset).limit(per_page + 1)).all()
+        has_next = len(data_set) > per_page
+        data_set = data_set[:per_page]
+        total = pages = None
+    elif total is not None:
+        data_set = session.exec(query.offset(offset).limit(per_page)).all()
+    elif not count_cache_ttl and window_count_supported(session.get_bind().dialect):
+        # One round-trip: every row carries the total of the unpaginated query
+        rows = session.execute(
+            query.add_columns(func.count().over().label("total_count"))
+            .offset(offset)
+            .limit(per_page)
+        ).all()
+        data_set = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        else:
+            total = count_total(query, session) if offset else 0
+    else:
+        data_set = session.exec(query.offset(offset).limit(per_page)).all()
+        total = count_total(query, session, ttl=count_cache_ttl)
+    if include_total:
+        has_next = offset + len(data_set) < total
+        pages = -(-total // per_page)
 
+    if not to_dict:
+        return Page.create(data_set, current_page, per_page, total, has_next=has_next)
     return {
-        "data_set": page_data.data_set,
+        "data_set": data_set,
         "current": current_page,
         "per_page": per_page,
-        "total_pages": page_data.pages,
-        "total_data": page_data.total,
-        "previous": page_data.previous_page,
-        "next": page_data.next_page,
+        "total_pages": pages,
+        "total_data": total,
+        "previous": current_page - 1 if current_page > 1 else None,
+        "next": current_page + 1 if has_next else None,
+    }
+
+
+def paginate_seek(
+    query,
+    session: Session,
+    cursor: Any,
+    per_page: int,
+    cursor_column: Optional[str | List[str]] = None,
+    direction: str = "asc",
+) -> dict:
+    """
+    Paginates a query by a unique column (keyset pagination) instead of OFFSET.
+
+    Each page seeks past the last value of the previous one with
+    `WHERE column > :cursor ORDER BY column LIMIT :per_page + 1`, so the database
+    never scans the rows of earlier pages and deep pages cost the same as the
+    first. The extra row only tells whether a next page exists, so no COUNT is
+    issued. Any ordering on `query` is replaced by the cursor column order.
+
+    Args:
+        query: The SQLAlchemy query to paginate.
+        session (Session): The SQLAlchemy session.
+        cursor (Any): The last cursor value of the previous page, or None for the first page.
+            A list of values when paging by several columns.
+        per_page (int): The number of items per page.
+        cursor_column (Optional[str | List[str]], optional): The column to page by. It
+            must be unique, or rows sharing a value across a page boundary are skipped.
+            Pass a list such as `["name", "id"]` to page by a non-unique column with
+            a unique tiebreaker, compared as a row value. Defaults to the primary key,
+            paged as a list of columns when it spans several.
+        direction (str, optional): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        dict: The page rows, whether a next page exists and the cursor to request it with.
+
+    Raises:
+        PaginationError: If per_page is less than 1 or direction is unknown.
+    """
+    if per_page < 1:
+        raise PaginationError("The page size needs to be >= 1")
+    if direction not in ("asc", "desc"):
+        raise PaginationError(f"Unknown pagination direction: {direction}")
+
+    model_class = query.column_descriptions[0]["entity"]
+    names = cursor_column
+    if not names:
+        # Every primary key column, so the keyset is unique on composite keys too
+        names = primary_key_names(model_class)
+        names = names[0] if len(names) == 1 else list(names)
+    columns = column_map(model_class)
+    if isinstance(names, str):
+        key = column = columns[names]
+        order = [column]
+    else:
+        order = [columns[name] for name in names]
+        key = tuple_(*order)
+        if cursor is not None:
+            cursor = tuple_(*cursor)
+    if direction == "asc":
+        query = query.order_by(None).order_by(*[column.asc() for column in order])
+        if cursor is not None:
+            query = query.where(key > cursor)
+    else:
+        query = query.order_by(None).order_by(*[column.desc() for column in order])
+        if cursor is not None:
+            query = query.where(key < cursor)
+    data_set = session.exec(query.limit(per_page + 1)).all()
+    has_next = len(data_set) > per_page
+    data_set = data_set[:per_page]
+
+    next_cursor = None
+    if has_next:
+        next_cursor = [getattr(data_set[-1], column.key) for column in order]
+        if isinstance(names, str):
+            next_cursor = next_cursor[0]
+    return {
+        "data_set": data_set,
+        "per_page": per_page,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
     }
 
 
+def serialize(models, joins=None) -> List[dict]:
+    """
+    Converts ORM rows to dictionaries with `to_dict`.
+
+    The per-row loop runs inside `map`, so no Python-level loop body executes
+    per row, and rows go straight to the serializer generated for their model
+    class instead of looking it up through `to_dict` each time.
+
+    Args:
+        models: The model instances to serialize.
+        joins (optional): The relationships to include in each dictionary.
+
+    Returns:
+        List[dict]: One dictionary per model.
+    """
+    if joins:
+        # Every row tests each relationship against `joins`; a set makes that O(1)
+        joins = frozenset(join for join in joins if isinstance(join, str)) or None
+    if models and isinstance(models[0], BaseModel):
+        return list(map(make_serializer(type(models[0])), models, repeat(joins)))
+    return list(map(methodcaller("to_dict", joins=joins), models))
+
+
+def paginated_view(query, session: Session, joins=None, **kwargs) -> dict:
+    """
+    Returns one page of `query` with its pagination metadata, rows as dictionaries.
+
+    When a `cursor` is given the page is fetched with keyset pagination instead.
+    """
+    if kwargs.get("cursor") is not None:
+        return seek_view(query, session, joins, **kwargs)
+    view = paginate(
+        query,
+        session=session,
+        current_page=kwargs.get("page", DEFAULT_PAGE),
+        per_page=kwargs.get("per_page", DEFAULT_PER_PAGE),
+        count_cache_ttl=kwargs.get("count_cache_ttl"),
+        include_total=kwargs.get("include_total", True),
+    )
+    view["data_set"] = serialize(view["data_set"], joins)
+    return view
+
+
+def seek_view(query, session: Session, joins=None, **kwargs) -> dict:
+    """
+    Returns the page after `cursor` using keyset pagination, rows as dictionaries.
+    """
+    view = paginate_seek(
+        query,
+        session=session,
+        cursor=kwargs.get("cursor"),
+        per_page=kwargs.get("per_page", DEFAULT_PER_PAGE),
+        cursor_column=kwargs.get("cursor_column"),
+        direction=kwargs.get("direction", "asc"),
+    )
+    view["data_set"] = serialize(view["data_set"], joins)
+    return view
+
+
+def all_view(query, session: Session, joins=None, **kwargs) -> List[dict]:
+    """
+    Returns every row of `query` as a dictionary.
+    """
+    return serialize(session.exec(query).all(), joins)
+
+
+# `mode` values accepted by Controller.list; unknown modes fall back to "all".
+VIEW_HANDLERS = {
+    "paginated": paginated_view,
+    "seek": seek_view,
+    "all": all_view,
+}
+
+
 ModelClass = TypeVar("ModelClass", bound=SQLModel)
 
 
@@ -111,35 +546,188 @@ class Controller(Generic[ModelClass]):
 
     Attributes:
         engine: The SQLAlchemy engine to use for database connections.
+        session (Session | None): The session shared by the calls running inside
+            a `with controller:` block or `unit_of_work()`, if any.
     """
 
     session: Session | None
 
-    def __init__(self, engine=None):
+    def __init__(
+        self,
+        engine=None,
+        strict_loading: Optional[bool] = None,
+        result_cache_ttl: Optional[float] = None,
+    ):
         """
         Initializes the Controller with a database engine.
 
         Args:
             engine (optional): The SQLAlchemy engine to use. If not provided, it will be obtained using get_engine().
+            strict_loading (Optional[bool], optional): Make relationships that were not
+                requested in `joins` raise on access instead of lazy loading them one row
+                at a time. Meant for development, to catch N+1 queries early. Defaults to
+                the SQLMODEL_CONTROLLER_STRICT environment variable.
+            result_cache_ttl (Optional[float], optional): Seconds to reuse the results of
+                repeated `get` and `list` calls. Writes through any controller of the
+                same model drop them. Cached results are shared between callers and
+                must not be mutated. Defaults to no caching.
         """
         self.engine = engine or get_engine()
+        self.strict_loading = (
+            STRICT_LOADING if strict_loading is None else strict_loading
+        )
+        self.result_cache_ttl = result_cache_ttl
         self.session = None
+        self._owns_session = False
+        self._Session = sessionmaker(
+            bind=self.engine.execution_options(compiled_cache=compiled_cache),
+            class_=Session,
+            expire_on_commit=False,
+        )
+        self._depth = 0
 
     def __enter__(self):
-        if not self.session:
-            self.session = Session(self.engine)
+        if self.session is None:
+            current = _current_session.get()
+            if current is not None and current[0] is self.engine:
+                self.session = current[1]
+                self._owns_session = False
+            else:
+                self.session = self._Session()
+                self._owns_session = True
+        self._depth += 1
         return self
 
     def __exit__(self, type_: Any, value: Any, traceback: Any) -> None:
-        if self.session is None:
-            self.session.close()
+        self._depth -= 1
+        if self._depth == 0 and self.session is not None:
+            if self._owns_session:
+                self.session.close()
             self.session = None
 
-    @property
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Shares a single Session across every controller call made inside the block.
+
+        The calls reuse one pooled connection instead of checking one out per
+        operation. Other controllers on the same engine join the session too,
+        for as long as the block runs in the current thread or task. Operations
+        in the block only flush; everything is committed once when the block
+        exits and rolled back if it raises.
+
+        Yields:
+            Session: The session used by the controller calls in the block.
+        """
+        with self:
+            current = _current_session.get()
+            if current is not None and current[1] is self.session:
+                # Nested: the outermost unit of work commits
+                yield self.session
+                return
+            token = _current_session.set((self.engine, self.session))
+            try:
+                yield self.session
+                self.session.commit()
+                for model_class in self.session.info.pop("written_models", ()):
+                    invalidate_results(model_class)
+            except Exception:
+                self.session.rollback()
+                self.session.info.pop("written_models", None)
+                raise
+            finally:
+                _current_session.reset(token)
+
+    @contextmanager
+    def _dao(self):
+        """
+        Opens (or joins) the controller's session and yields a DAO bound to it.
+
+        Yields:
+            Dao: The DAO for this controller's model class and session.
+        """
+        with self:
+            yield Dao(self.session, self.model_class, self.strict_loading)
+
+    def _commit(self):
+        """
+        Commits the session, or only flushes it inside a unit of work.
+
+        A unit of work commits once when its block exits, so the operations in it
+        just flush their changes (populating generated ids) instead of paying
+        for a COMMIT each.
+        """
+        current = _current_session.get()
+        if current is not None and current[1] is self.session:
+            self.session.flush()
+            written = self.session.info.setdefault("written_models", set())
+            written.add(self.model_class)
+        else:
+            self.session.commit()
+            invalidate_results(self.model_class)
+
+    def _cached(self, key: tuple, load):
+        """
+        Returns the cached result for `key`, calling `load` on a miss or expiry.
+
+        Reads inside an open session bypass the cache, so they see the session's
+        own uncommitted writes.
+
+        Args:
+            key (tuple): Identifies the call and its arguments.
+            load: Computes the result.
+
+        Returns:
+            The result of `load`, possibly from an earlier call.
+        """
+        current = _current_session.get()
+        if (
+            not self.result_cache_ttl
+            or self.session is not None
+            or (current is not None and current[0] is self.engine)
+        ):
+            return load()
+
+        key = (self.engine, *key)
+        now = time.monotonic()
+        cached = _result_cache.get(self.model_class, {}).get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        generation = _result_generation.get(self.model_class, 0)
+        result = load()
+        if _result_generation.get(self.model_class, 0) != generation:
+            # The model was written while loading; don't cache the result
+            return result
+        cache = _result_cache.setdefault(self.model_class, {})
+        if len(cache) >= RESULT_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (result, now + self.result_cache_ttl)
+        return result
+
+    @staticmethod
+    def clear_statement_cache():
+        """
+        Drops the cached statements and column maps shared by every controller.
+
+        Useful after remapping models at runtime (e.g. in test suites that
+        recreate tables with the same classes).
+        """
+        compiled_get.cache_clear()
+        compiled_get_many.cache_clear()
+        load_options.cache_clear()
+        unique_keys.cache_clear()
+        column_map.cache_clear()
+        primary_key_names.cache_clear()
+        value_parsers.cache_clear()
+
+    @cached_property
     def model_class(self) -> type[ModelClass]:
         """
         Returns the SQLModel class associated with this controller.
 
+        Resolved from `Controller[Model]` on first access and kept on the instance.
+
         Returns:
             type[ModelClass]: The SQLModel class.
         """
@@ -147,13 +735,17 @@ class Controller(Generic[ModelClass]):
 
     @property
     def Dao(self):
-        return Dao[self.model_class]
+        return Dao
 
     def __get_return(self, model, returns_object):
         if not returns_object:
             view = model.id
         else:
-            self.session.refresh(model)
+            # The instance already holds what was written; only the attributes
+            # the flush expired (database-generated values) need to be read back
+            expired = inspect(model).expired_attributes
+            if expired:
+                self.session.refresh(model, attribute_names=list(expired))
             view = model.to_dict()
         return view
 
@@ -170,21 +762,8 @@ class Controller(Generic[ModelClass]):
         Returns:
             Union[dict, List[dict]]: The query result in the specified format.
         """
-        mode = kwargs.get("mode", "all")
-        if mode == "paginated":
-            view = paginate(
-                query,
-                session=session,
-                current_page=kwargs.get("page", DEFAULT_PAGE),
-                per_page=kwargs.get("per_page", DEFAULT_PER_PAGE),
-            )
-            models = view.get("data_set")
-            view["data_set"] = [model.to_dict(joins=joins) for model in models]
-
-        else:
-            models = session.exec(query).all()
-            view = [model.to_dict(joins=joins) for model in models]
-        return view
+        handler = VIEW_HANDLERS.get(kwargs.get("mode", "all"), all_view)
+        return handler(query, session, joins, **kwargs)
 
     def get(
         self,
@@ -203,33 +782,115 @@ class Controller(Generic[ModelClass]):
         Returns:
             Union[dict, List[dict]]: The retrieved record(s) as a dictionary or list of dictionaries.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        return self._cached(
+            ("get", repr(by), repr(value), repr(joins)),
+            lambda: self._get(by, value, joins),
+        )
+
+    def _get(self, by, value, joins):
+        with self._dao() as dao:
             model = dao.get(by, value, joins=joins)
             view = model.to_dict(joins=joins) if model else {}
         return view
 
-    def list(self, filter: dict = {}, order: dict = {}, joins: list = [], **kwargs):
+    def get_many(
+        self,
+        by: str,
+        values: List[Any],
+        joins: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Retrieves the records matching any of the given values in one query.
+
+        Use this instead of calling `get` in a loop, which costs one query per value.
+
+        Args:
+            by (str): The column to filter by.
+            values (List[Any]): The values to look up.
+            joins (Optional[List[str]], optional): A list of joined relationships to include.
+
+        Returns:
+            dict: The retrieved records as dictionaries, keyed by their `by` value.
+                Values without a matching record are left out.
+        """
+        with self._dao() as dao:
+            models = dao.get_many(by, values, joins=joins)
+            view = {getattr(model, by): model.to_dict(joins=joins) for model in models}
+        return view
+
+    def list(
+        self,
+        filter: Optional[Mapping[str, Any]] = None,
+        order: Optional[Mapping[str, str]] = None,
+        joins: Sequence = (),
+        **kwargs,
+    ):
         """
         Retrieves a list of records from the database based on the given filters and ordering.
 
         Args:
-            filter (dict, optional): A dictionary of filters to apply to the query.
-            order (dict, optional): A dictionary specifying the ordering of the results.
-            joins (list, optional): A list of joined relationships to include.
+            filter (Optional[Mapping[str, Any]], optional): A mapping of filters to apply to the query.
+            order (Optional[Mapping[str, str]], optional): A mapping specifying the ordering of the results.
+            joins (Sequence, optional): The joined relationships to include.
             **kwargs: Additional keyword arguments for pagination and result formatting.
+                With `mode="stream"`, rows are fetched `batch_size` at a time and
+                returned lazily as a generator of dictionaries. With `raw=True`,
+                the table rows are returned as plain dictionaries of column values
+                (optionally only `columns`), without building model instances.
 
         Returns:
-            Union[dict, List[dict]]: The query results in the specified format.
+            Union[dict, List[dict], Iterator[dict]]: The query results in the specified format.
+
+        Raises:
+            ValueError: If `raw=True` is combined with joins or a mode other than "all".
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        filter = dict(filter or {})
+        order = dict(order or {})
+        if kwargs.get("mode") == "stream":
+            return self._stream(
+                filter, order, joins, kwargs.get("batch_size", DEFAULT_BATCH_SIZE)
+            )
+        key = (
+            "list", repr(filter), repr(order), repr(joins), repr(sorted(kwargs.items()))
+        )
+        return self._cached(key, lambda: self._list(filter, order, joins, **kwargs))
+
+    def _list(self, filter: dict, order: dict, joins: Sequence, **kwargs):
+        if kwargs.get("raw"):
+            if joins or kwargs.get("mode", "all") != "all":
+                raise ValueError('raw=True only supports mode="all" without joins')
+            with self._dao() as dao:
+                rows = dao.list_raw(filter, order, kwargs.get("columns"))
+            return list(map(dict, rows))
+        with self._dao() as dao:
             query = dao.list(filter, order, joins)
             view = self._get_view(
                 query=query, session=self.session, joins=joins, **kwargs
             )
         return view
 
+    def _stream(self, filter: dict, order: dict, joins: Sequence, batch_size: int):
+        """
+        Yields records as dictionaries, fetching them from the database in batches.
+
+        Only one batch of ORM objects is held in memory at a time. The session
+        stays open until the generator is exhausted or closed.
+
+        Args:
+            filter (dict): A dictionary of filters to apply to the query.
+            order (dict): A dictionary specifying the ordering of the results.
+            joins (Sequence): The joined relationships to include.
+            batch_size (int): The number of rows fetched per round-trip.
+
+        Yields:
+            dict: Each record serialized with `to_dict`.
+        """
+        with self._dao() as dao:
+            query = dao.list(filter, order, joins)
+            result = self.session.exec(query.execution_options(yield_per=batch_size))
+            for model in result:
+                yield model.to_dict(joins=joins)
+
     def create(self, data: dict, returns_object: bool = False) -> int | dict:
         """
         Creates a new record in the database.
@@ -240,13 +901,37 @@ class Controller(Generic[ModelClass]):
         Returns:
             int: The ID of the newly created record.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        with self._dao() as dao:
             model = dao.create(data)
-            self.session.commit()
+            self._commit()
             view = self.__get_return(model, returns_object)
         return view
 
+    def create_many(
+        self, data: List[dict], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[int]:
+        """
+        Creates several records in one transaction.
+
+        Rows are flushed `batch_size` at a time, each batch as a single
+        multi-row INSERT, and committed once at the end.
+
+        Args:
+            data (List[dict]): The data for each new record.
+            batch_size (int, optional): The number of rows inserted per statement.
+
+        Returns:
+            List[int]: The IDs of the new records, in the same order as `data`.
+        """
+        ids = []
+        with self._dao() as dao:
+            for start in range(0, len(data), batch_size):
+                models = dao.create_many(data[start : start + batch_size])
+                self.session.flush()
+                ids.extend(model.id for model in models)
+            self._commit()
+        return ids
+
     def update(
         self,
         by: str | List[str],
@@ -265,18 +950,50 @@ class Controller(Generic[ModelClass]):
         Returns:
             int: The number of records updated.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        with self._dao() as dao:
             model = dao.update(by, value, data)
-            self.session.commit()
+            self._commit()
             view = self.__get_return(model, returns_object)
         return view
 
+    def update_bulk(
+        self, by: str | List[str], value: Any | List[Any], data: dict
+    ) -> int:
+        """
+        Updates every record matching the selector with a single UPDATE statement.
+
+        Unlike `update`, the records are not loaded first, which saves a SELECT
+        per call but also emits the UPDATE when nothing changes.
+
+        Args:
+            by (str | List[str]): The column(s) to identify the record(s) to update.
+            value (Any | List[Any]): The value(s) to identify the record(s) to update.
+            data (dict): The new data to update the record(s) with.
+
+        Returns:
+            int: The number of records matched.
+        """
+        with self._dao() as dao:
+            count = dao.update_bulk(by, value, data)
+            self._commit()
+        return count
+
+    def update_many(self, data: List[dict]):
+        """
+        Updates several records by primary key in a single executemany UPDATE.
+
+        Args:
+            data (List[dict]): The new data for each record, including its primary key.
+        """
+        with self._dao() as dao:
+            dao.update_many(data)
+            self._commit()
+
     def upsert(
         self,
         by: Optional[str] = None,
         value: Optional[Any] = None,
-        data: dict = {},
+        data: Optional[Mapping[str, Any]] = None,
         returns_object: bool = False,
     ) -> int | dict:
         """
@@ -285,15 +1002,14 @@ class Controller(Generic[ModelClass]):
         Args:
             by (Optional[str], optional): The column to identify an existing record.
             value (Optional[Any], optional): The value to identify an existing record.
-            data (dict, optional): The data for the new or updated record.
+            data (Optional[Mapping[str, Any]], optional): The data for the new or updated record.
 
         Returns:
             int: The ID of the upserted record.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
-            model = dao.upsert(by, value, data)
-            self.session.commit()
+        with self._dao() as dao:
+            model = dao.upsert(by, value, dict(data or {}))
+            self._commit()
             view = self.__get_return(model, returns_object)
         return view
 
@@ -305,10 +1021,9 @@ class Controller(Generic[ModelClass]):
             by (str | List[str]): The column(s) to identify the record(s) to archive.
             value (Any | List[Any]): The value(s) to identify the record(s) to archive.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        with self._dao() as dao:
             dao.archive(by, value)
-            self.session.commit()
+            self._commit()
 
     def delete(self, by: str | List[str], value: Any | List[Any]):
         """
@@ -318,7 +1033,6 @@ class Controller(Generic[ModelClass]):
             by (str | List[str]): The column(s) to identify the record(s) to delete.
             value (Any | List[Any]): The value(s) to identify the record(s) to delete.
         """
-        with self:
-            dao = self.Dao(self.session, self.model_class)
+        with self._dao() as dao:
             dao.delete(by, value)
-            self.session.commit()
+            self._commit()
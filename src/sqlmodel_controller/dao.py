@@ -1,40 +1,389 @@
-from datetime import datetime
-from pytz import utc
-from typing import Any, Dict, Optional, List, TypeVar, Generic
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+import operator
+import re
+from datetime import date, datetime, timezone
+from enum import Enum
+from functools import cached_property, lru_cache, partial
+from typing import Any, Callable, Dict, Optional, List, TypeVar, Generic
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from sqlalchemy import and_, or_, not_
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy import UniqueConstraint, bindparam, delete, inspect, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlmodel import Session, SQLModel, select
+from .model import unwrap_optional
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
+UTC = timezone.utc
 
+# MySQL error 1062, e.g. "Duplicate entry 'a-b' for key 'persons.uq_name_city_idx'"
+DUPLICATE_ENTRY = re.compile(
+    r"Duplicate entry '(?P<values>.*?)' for key '(?:[^'.]+\.)?(?P<key>[^']+)'"
+)
 
-def apply_nested_joins(relationship_attr, inner_joins):
+# PostgreSQL SQLSTATE 23505, e.g. "Key (name, city)=(a, b) already exists."
+UNIQUE_VIOLATION = re.compile(
+    r"Key \((?P<columns>.*?)\)=\((?P<values>.*)\) already exists"
+)
+
+# Operators accepted in range filters, e.g. `{"age": {"gte": 18, "not-in": [30]}}`.
+# Unknown operators are ignored.
+FILTER_OPERATORS = {
+    "eq": operator.eq,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "in": lambda column, value: column.in_(value),
+    "contains": lambda column, value: column.contains(value),
+    "like": lambda column, value: column.like(value),
+    "not-eq": lambda column, value: not_(column == value),
+    "not-gte": lambda column, value: not_(column >= value),
+    "not-lte": lambda column, value: not_(column <= value),
+    "not-gt": lambda column, value: not_(column > value),
+    "not-lt": lambda column, value: not_(column < value),
+    "not-in": lambda column, value: not_(column.in_(value)),
+    "not-like": lambda column, value: not_(column.like(value)),
+    "not-contains": lambda column, value: not_(column.contains(value)),
+}
+
+# INSERT constructs with a native upsert clause, by dialect name
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+    "mysql": mysql.insert,
+    "mariadb": mysql.insert,
+}
+
+# Directions accepted in `order`, e.g. `{"name": "asc", "id": "desc"}`.
+# Unknown directions are ignored.
+ORDER_DIRECTIONS = {
+    "asc": lambda column: column,
+    "desc": lambda column: column.desc(),
+}
+
+
+def duplicate_entry_message(error: Exception) -> Optional[str]:
+    """
+    Describe the columns and values of a duplicate entry error.
+
+    Only integrity errors are inspected, and the driver's error code tells a
+    duplicate entry apart: MySQL error 1062 or PostgreSQL SQLSTATE 23505. For
+    MySQL the column names are taken from the unique key name, which is
+    expected to follow the `<prefix>_<column>_..._<suffix>` convention.
+
+    Args:
+        error (Exception): The error raised by the database.
+
+    Returns:
+        Optional[str]: e.g. "name = a, city = b", or None for other errors.
+    """
+    if not isinstance(error, IntegrityError):
+        return None
+    orig = error.orig
+    args = getattr(orig, "args", ())
+    code = args[0] if args else None
+    if getattr(orig, "errno", code) == 1062:
+        match = DUPLICATE_ENTRY.search(str(orig))
+        if match is None:
+            return None
+        values = match["values"].split("-")
+        columns = match["key"].split("_")[1:-1]
+    else:
+        if isinstance(code, dict):
+            # pg8000 reports the server's error fields as a dict
+            sqlstate, detail = code.get("C"), code.get("D")
+        else:
+            sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+            detail = getattr(getattr(orig, "diag", None), "message_detail", None)
+        if sqlstate != "23505":
+            return None
+        match = UNIQUE_VIOLATION.search(detail or str(orig))
+        if match is None:
+            return None
+        values = match["values"].split(", ")
+        columns = match["columns"].split(", ")
+    return ", ".join(f"{col} = {val}" for col, val in zip(columns, values))
+
+
+class ColumnMap(dict):
+    """
+    The mapped attributes of a model class, keyed by name.
+
+    Names that are not mapped (e.g. hybrid properties) fall back to `getattr`
+    on the model class, so lookups behave like `getattr(model_class, name)`.
+    """
+
+    def __init__(self, model_class: type[SQLModel]):
+        keys = inspect(model_class).attrs.keys()
+        super().__init__((key, getattr(model_class, key)) for key in keys)
+        self.model_class = model_class
+
+    def __missing__(self, key: str):
+        return getattr(self.model_class, key)
+
+
+@lru_cache(maxsize=None)
+def column_map(model_class: type[SQLModel]) -> ColumnMap:
+    """
+    Returns the attribute map of a model class, built once per class.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class.
+
+    Returns:
+        ColumnMap: The model's mapped attributes keyed by name.
+    """
+    return ColumnMap(model_class)
+
+
+def parse_enum(enum_class: type[Enum], value):
+    """
+    Returns the member of `enum_class` named `value`, or `value` unchanged.
+    """
+    if isinstance(value, str) and not isinstance(value, enum_class):
+        return enum_class.__members__.get(value, value)
+    return value
+
+
+def parse_isoformat(date_class: type[date], value):
+    """
+    Returns `value` parsed as an ISO string of `date_class`, or unchanged.
+    """
+    if isinstance(value, str):
+        try:
+            return date_class.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+@lru_cache(maxsize=None)
+def value_parsers(model_class: type[SQLModel]) -> dict[str, Callable[[Any], Any]]:
+    """
+    Returns the parsers turning written values into a model's declared types.
+
+    Table models don't validate what they are given, so an enum passed by name
+    or a date passed as an ISO string would otherwise stay a string on the
+    instance, and `to_dict` would return it as-is. Only enum, date and
+    datetime fields get a parser; values that don't parse are left unchanged.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class.
+
+    Returns:
+        dict[str, Callable[[Any], Any]]: The parser of each field, keyed by name.
+    """
+    parsers = {}
+    for name, field in model_class.model_fields.items():
+        annotation = unwrap_optional(field.annotation)
+        if not isinstance(annotation, type):
+            continue
+        if issubclass(annotation, Enum):
+            parsers[name] = partial(parse_enum, annotation)
+        elif issubclass(annotation, date):
+            parsers[name] = partial(parse_isoformat, annotation)
+    return parsers
+
+
+@lru_cache(maxsize=None)
+def primary_key_names(model_class: type[SQLModel]) -> tuple[str, ...]:
+    """
+    Returns the attribute names of a model's primary key columns, in order.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class.
+
+    Returns:
+        tuple[str, ...]: The primary key attribute names.
+    """
+    mapper = inspect(model_class)
+    return tuple(mapper.get_property_by_column(c).key for c in mapper.primary_key)
+
+
+@lru_cache(maxsize=512)
+def compiled_get(model_class: type[SQLModel], by: tuple[str, ...]):
+    """
+    Build the selector statement used by `Dao.get` once per model and column set.
+
+    The values are left as `by_<n>` bind parameters, so repeated lookups reuse
+    the same statement object and hit SQLAlchemy's compiled cache instead of
+    rebuilding the WHERE clause on every call.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class to select from.
+        by (tuple[str, ...]): The column(s) to filter by.
+
+    Returns:
+        A select statement with one bind parameter per column in `by`.
+    """
+    columns = column_map(model_class)
+    conditions = [
+        columns[column] == bindparam(f"by_{index}")
+        for index, column in enumerate(by)
+    ]
+    return select(model_class).where(*conditions)
+
+
+def eager_load(relationship_attr, load=None):
+    """
+    Eager load a relationship with the strategy that suits its cardinality.
+
+    Collections use `selectinload`, which fetches them in one extra `IN` query
+    instead of multiplying the parent rows with a JOIN. Many-to-one and
+    one-to-one relationships use `joinedload`, which adds a single LEFT OUTER
+    JOIN to the parent query.
+
+    Args:
+        relationship_attr: The relationship attribute to load.
+        load (optional): The loader option to chain from, for nested relationships.
+
+    Returns:
+        The loader option for the relationship.
+    """
+    if relationship_attr.property.uselist:
+        strategy = selectinload if load is None else load.selectinload
+    else:
+        strategy = joinedload if load is None else load.joinedload
+    return strategy(relationship_attr)
+
+
+def apply_nested_joins(relationship_attr, inner_joins, load=None):
     """
     Apply nested joins to a relationship attribute.
 
+    Each level is loaded with `eager_load`, so collections are fetched with one
+    extra `IN` query and single related objects with a JOIN, instead of lazily
+    loading them once per parent row. Every inner join gets its own option
+    chain from the outer relationship, rather than several `.options()` calls
+    on one shared loader, which keeps building the cache key linear in the
+    number of joins.
+
     Args:
         relationship_attr: The relationship attribute to join.
         inner_joins: A list of inner joins to apply.
+        load (optional): The loader option to chain from, for deeper levels.
 
     Returns:
-        A joinedload object with nested joins applied.
+        list: One loader option per path through the nested joins.
     """
-    if inner_joins:
-        if isinstance(inner_joins[0], list):
-            return joinedload(relationship_attr).options(
+    load = eager_load(relationship_attr, load)
+    if not inner_joins:
+        return [load]
+    related_class = relationship_attr.property.mapper.class_
+    options = []
+    for join in inner_joins:
+        if isinstance(join, (list, tuple)):
+            inner_join, *deeper_joins = join
+            options.extend(
                 apply_nested_joins(
-                    getattr(relationship_attr.mapper.class_, inner_joins[0][0]),
-                    inner_joins[0][1:],
+                    getattr(related_class, inner_join), deeper_joins, load
                 )
             )
         else:
-            return joinedload(relationship_attr).joinedload(
-                getattr(relationship_attr.mapper.class_, inner_joins[0])
-            )
-    else:
-        return joinedload(relationship_attr)
+            options.append(eager_load(getattr(related_class, join), load))
+    return options
+
+
+@lru_cache(maxsize=None)
+def unique_keys(model_class: type[SQLModel]) -> tuple:
+    """
+    Lists the column sets that identify a row of the model's table.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class to inspect.
+
+    Returns:
+        tuple: One tuple of column names per primary key, unique constraint or
+        unique index.
+    """
+    table = model_class.__table__
+    keys = {tuple(column.key for column in table.primary_key.columns)}
+    keys.update(
+        tuple(column.key for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    )
+    keys.update(
+        tuple(column.key for column in index.columns)
+        for index in table.indexes
+        if index.unique
+    )
+    return tuple(keys)
+
+
+def freeze_joins(joins) -> tuple:
+    """
+    Convert a (possibly nested) list of joins into hashable tuples.
+
+    Args:
+        joins: The joins, as passed to `Dao.get` or `Dao.list`.
+
+    Returns:
+        tuple: The same joins with every list turned into a tuple.
+    """
+    return tuple(
+        freeze_joins(join) if isinstance(join, (list, tuple)) else join
+        for join in joins
+    )
+
+
+@lru_cache(maxsize=512)
+def load_options(model_class: type[SQLModel], joins: tuple, strict_loading: bool):
+    """
+    Build the loader options for a set of joins once per model.
+
+    Loader options are immutable, so the same tuple is reused by every query
+    requesting those joins instead of being rebuilt on each call.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class the joins start from.
+        joins (tuple): The joins, frozen with `freeze_joins`. A string joins a
+            relationship of the model; a tuple joins its first element and then
+            the relationships of that related model.
+        strict_loading (bool): Add `raiseload("*")` so any relationship not in
+            `joins` raises instead of lazy loading.
+
+    Returns:
+        tuple: The loader options to pass to `query.options`.
+    """
+    options = []
+    for join in joins:
+        if isinstance(join, tuple):
+            # The first element is the join for the outer model and the
+            # remaining elements are the joins for the inner model
+            outer_join, *inner_joins = join
+            relationship_attr = getattr(model_class, outer_join, None)
+            if relationship_attr:
+                options.extend(apply_nested_joins(relationship_attr, inner_joins))
+        else:
+            # A string is a join for the current model
+            relationship_attr = getattr(model_class, join, None)
+            if relationship_attr:
+                options.append(eager_load(relationship_attr))
+    if strict_loading:
+        # Anything not requested in `joins` raises instead of lazy loading
+        options.append(raiseload("*"))
+    return tuple(options)
+
+
+@lru_cache(maxsize=512)
+def compiled_get_many(model_class: type[SQLModel], by: str):
+    """
+    Build the `IN` statement used by `Dao.get_many` once per model and column.
+
+    The values are sent as one expanding `values` bind parameter, so lookups
+    with any number of values share the same statement.
+
+    Args:
+        model_class (type[SQLModel]): The SQLModel class to select from.
+        by (str): The column to filter by.
+
+    Returns:
+        A select statement with an expanding `values` bind parameter.
+    """
+    column = column_map(model_class)[by]
+    return select(model_class).where(column.in_(bindparam("values", expanding=True)))
 
 
 class Dao(Generic[ModelType]):
@@ -48,27 +397,56 @@ class Dao(Generic[ModelType]):
         db_session (Session): The SQLAlchemy session object.
         model_class (type[ModelType]): The SQLModel class this DAO operates on.
         now (datetime): The current UTC timestamp.
+        strict_loading (bool): Whether relationships outside `joins` raise on access.
     """
 
-    def __init__(self, session: Session, model_class: type[ModelType]):
+    def __init__(
+        self,
+        session: Session,
+        model_class: type[ModelType],
+        strict_loading: bool = False,
+    ):
         """
         Initialize the DAO with a database session and model class.
 
         Args:
             session (Session): The SQLAlchemy session object.
             model_class (type[ModelType]): The SQLModel class this DAO operates on.
+            strict_loading (bool, optional): Add `raiseload("*")` to queries so any
+                relationship not requested in `joins` raises instead of lazy loading.
         """
         self.db_session = session
         self.model_class = model_class
-        self.now = datetime.now().replace(tzinfo=utc)
+        self.strict_loading = strict_loading
 
-    def __exclude_none_from_dict(self, data: dict) -> dict:
-        return {k: v for k, v in data.items() if v is not None}
+    @cached_property
+    def now(self) -> datetime:
+        """
+        The current UTC timestamp, taken on first use and kept for this DAO.
+
+        Read-only operations never pay for it.
+        """
+        return datetime.now(UTC)
+
+    def __parse(self, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse the values written to enum and date fields, see `value_parsers`.
+        """
+        parsers = value_parsers(self.model_class)
+        if not parsers or parsers.keys().isdisjoint(obj_data):
+            return obj_data
+        return {
+            field: parsers[field](value) if field in parsers else value
+            for field, value in obj_data.items()
+        }
 
     def __populate_to_update(self, model: ModelType, obj_data: Dict[str, Any]):
         """
         Update an existing model instance with new data.
 
+        None values are skipped, and so are values equal to the current ones, so
+        a no-op update leaves the instance clean and emits no UPDATE at all.
+
         Args:
             model: The existing model instance to update.
             obj_data (Dict[str, Any]): The new data to update the model with.
@@ -76,10 +454,36 @@ class Dao(Generic[ModelType]):
         Returns:
             The updated model instance.
         """
-        data_parsed = self.__exclude_none_from_dict(obj_data)
-        for field, value in data_parsed.items():
-            setattr(model, field, value)
-        model.updated_at = self.now
+        for field, value in self.__parse(obj_data).items():
+            if value is not None and getattr(model, field) != value:
+                setattr(model, field, value)
+        if self.db_session.is_modified(model):
+            model.updated_at = self.now
+
+    def __selector(self, by, value):
+        """
+        Build the WHERE clause matching column(s) to value(s).
+
+        The clause can be applied to SELECT, UPDATE and DELETE statements alike.
+
+        Args:
+            by (str | List[str]): The column(s) to filter by.
+            value (Any | List[Any]): The value(s) to filter with.
+
+        Returns:
+            The WHERE clause.
+
+        Raises:
+            ValueError: If the lengths of 'by' and 'value' lists don't match.
+        """
+        columns = column_map(self.model_class)
+        if not isinstance(by, list):
+            return columns[by] == value
+        if not isinstance(value, list) or len(by) != len(value):
+            raise ValueError("Length of 'by' and 'value' lists must be the same.")
+        if len(by) == 1:
+            return columns[by[0]] == value[0]
+        return and_(*[columns[b] == v for b, v in zip(by, value)])
 
     def __apply_selector(self, query, by, value):
         """
@@ -96,15 +500,61 @@ class Dao(Generic[ModelType]):
         Raises:
             ValueError: If the lengths of 'by' and 'value' lists don't match.
         """
-        if isinstance(by, list) and isinstance(value, list):
-            if len(by) != len(value):
-                raise ValueError("Length of 'by' and 'value' lists must be the same.")
+        return query.where(self.__selector(by, value))
 
-            conditions = [getattr(self.model_class, b) == v for b, v in zip(by, value)]
-            query = query.where(and_(*conditions))
-        else:
-            query = query.where(getattr(self.model_class, by) == value)
-        return query
+    def __build(self, obj_data: Dict[str, Any]) -> ModelType:
+        # Passing the timestamps skips their default factories, so every row of
+        # a call shares one datetime.now() instead of calling it twice per row
+        model = self.model_class(
+            **{**self.__parse(obj_data), "created_at": self.now, "updated_at": self.now}
+        )
+        if hasattr(model, "archived"):
+            model.archived = False
+        return model
+
+    def create_many(self, objs_data: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        Create several instances of the model in the database at once.
+
+        The instances are added together, so the next flush emits them as one
+        batched INSERT (SQLAlchemy's "insertmanyvalues") instead of one
+        statement per row.
+
+        Args:
+            objs_data (List[Dict[str, Any]]): The data to create each instance with.
+
+        Returns:
+            List: The new instances, in the same order as `objs_data`.
+        """
+        models = [self.__build(obj_data) for obj_data in objs_data]
+        self.db_session.add_all(models)
+        return models
+
+    def update_many(self, objs_data: List[Dict[str, Any]]):
+        """
+        Update several instances of the model, identified by their primary keys.
+
+        Runs as a single executemany UPDATE keyed on the primary key, without
+        loading the instances first. None values are skipped, like in `update`.
+
+        Args:
+            objs_data (List[Dict[str, Any]]): The new data for each instance. Every
+                dictionary must include the primary key column(s).
+        """
+        key = primary_key_names(self.model_class)
+        stamp = {}
+        if "updated_at" in column_map(self.model_class):
+            stamp["updated_at"] = self.now
+        rows = []
+        for obj_data in objs_data:
+            row = self.__parse(
+                {field: val for field, val in obj_data.items() if val is not None}
+            )
+            # A row left with nothing but its primary key has nothing to update
+            if row.keys() - key:
+                rows.append({**row, **stamp})
+        if rows:
+            self.db_session.exec(update(self.model_class), params=rows)
 
     def create(self, obj_data: Dict[str, Any]) -> ModelType:
         """
@@ -120,32 +570,13 @@ class Dao(Generic[ModelType]):
             Exception: If there's an error during creation, including duplicate entries.
         """
         try:
-            self.model = self.model_class(**obj_data)
-            self.model.created_at = self.now
-            self.model.updated_at = self.now
-            if hasattr(self.model, "archived"):
-                self.model.archived = 0
-
+            self.model = self.__build(obj_data)
             self.db_session.add(self.model)
             return self.model
 
         except SQLAlchemyError as e:
-            if "1062" in str(e):
-                duplicate_values = (
-                    str(e)
-                    .split("Duplicate entry")[1]
-                    .split("for key")[0]
-                    .strip()
-                    .split("-")
-                )
-                column_details = (
-                    str(e).split("for key")[1].split("\n")[0].strip().split(".")
-                )
-                columns = column_details[-1].split("_")[1:-1]
-                message_parts = [
-                    f"{col} = {val}" for col, val in zip(columns, duplicate_values)
-                ]
-                message = ", ".join(message_parts)
+            message = duplicate_entry_message(e)
+            if message is not None:
                 raise Exception(
                     f"Error creating {self.model_class.__name__}. Duplicate entry: {message}."
                 )
@@ -170,12 +601,52 @@ class Dao(Generic[ModelType]):
         Returns:
             The first matching instance of the model, or None if not found.
         """
-        query = select(self.model_class)
+        columns = tuple(by) if isinstance(by, list) else (by,)
+        values = tuple(value) if isinstance(by, list) else (value,)
+        if len(columns) != len(values):
+            raise ValueError("Length of 'by' and 'value' lists must be the same.")
+        if any(v is None for v in values):
+            # `column == None` renders as IS NULL only for literal values,
+            # so NULL lookups keep building the expression per call.
+            query = select(self.model_class)
+            query = self.__apply_joins(query, joins)
+            query = self.__apply_selector(query, by, value)
+            return self.db_session.exec(query).first()
+
+        if not joins and columns == primary_key_names(self.model_class):
+            # Served from the identity map when the row is already in the session
+            options = [raiseload("*")] if self.strict_loading else None
+            return self.db_session.get(self.model_class, values, options=options)
+
+        query = compiled_get(self.model_class, columns)
         query = self.__apply_joins(query, joins)
-        query = self.__apply_selector(query, by, value)
-        model = self.db_session.exec(query).first()
+        params = {f"by_{index}": v for index, v in enumerate(values)}
+        model = self.db_session.exec(query, params=params).first()
         return model
 
+    def get_many(
+        self,
+        by: str,
+        values: List[Any],
+        joins: Optional[List[str]] = None,
+    ) -> List[ModelType]:
+        """
+        Retrieve every instance of the model whose column matches one of the values.
+
+        Issues a single `IN` query instead of one query per value.
+
+        Args:
+            by (str): The column to filter by.
+            values (List[Any]): The values to match.
+            joins (Optional[List[str]]): Optional list of relationships to join.
+
+        Returns:
+            The matching instances of the model.
+        """
+        query = compiled_get_many(self.model_class, by)
+        query = self.__apply_joins(query, joins)
+        return self.db_session.exec(query, params={"values": list(values)}).all()
+
     def __apply_filter(self, query, filter):
         """
         Apply complex filters to a query.
@@ -187,72 +658,28 @@ class Dao(Generic[ModelType]):
         Returns:
             The query with all specified filters applied.
         """
+        columns = column_map(self.model_class)
         conditions = []
         for key, value in filter.items():
+            column = columns[key]
             if isinstance(value, list):
-                # Handle filtering for lists
-                or_conditions = [getattr(self.model_class, key) == v for v in value]
-                conditions.append(or_(*or_conditions))
+                # A list matches any of its values; IN never matches NULL, so a
+                # None in the list is checked separately
+                values = [v for v in value if v is not None]
+                if len(values) < len(value):
+                    conditions.append(or_(column.in_(values), column.is_(None)))
+                else:
+                    conditions.append(column.in_(values))
             elif isinstance(value, dict):  # range filter
-                range_filters = []
-                if "eq" in value:
-                    range_filters.append(getattr(self.model_class, key) == value["eq"])
-                if "gte" in value:
-                    range_filters.append(getattr(self.model_class, key) >= value["gte"])
-                if "lte" in value:
-                    range_filters.append(getattr(self.model_class, key) <= value["lte"])
-                if "gt" in value:
-                    range_filters.append(getattr(self.model_class, key) > value["gt"])
-                if "lt" in value:
-                    range_filters.append(getattr(self.model_class, key) < value["lt"])
-                if "in" in value:
-                    range_filters.append(
-                        getattr(self.model_class, key).in_(value["in"])
-                    )
-                if "contains" in value:
-                    range_filters.append(
-                        getattr(self.model_class, key).contains(value["contains"])
-                    )
-                if "like" in value:
-                    query = query.where(
-                        getattr(self.model_class, key).like(value["like"])
-                    )
-                if "not-eq" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key) == value["not-eq"])
-                    )
-                if "not-gte" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key) >= value["not-gte"])
-                    )
-                if "not-lte" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key) <= value["not-lte"])
-                    )
-                if "not-gt" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key) > value["not-gt"])
-                    )
-                if "not-lt" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key) < value["not-lt"])
-                    )
-                if "not-in" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key).in_(value["not-in"]))
-                    )
-                if "not-like" in value:
-                    query = query.where(
-                        not_(getattr(self.model_class, key).like(value["not-like"]))
-                    )
-                if "not-contains" in value:
-                    range_filters.append(
-                        not_(getattr(self.model_class, key).contains(value["contains"]))
-                    )
-                if range_filters:
-                    query = query.where(and_(*range_filters))
+                conditions.extend(
+                    FILTER_OPERATORS[op](column, operand)
+                    for op, operand in value.items()
+                    if op in FILTER_OPERATORS
+                )
             else:
-                query = query.where(getattr(self.model_class, key) == value)
+                conditions.append(column == value)
+        if conditions:
+            query = query.where(*conditions)
         return query
 
     def __apply_ordernation(self, query, order):
@@ -266,13 +693,14 @@ class Dao(Generic[ModelType]):
         Returns:
             The query with the specified ordering applied.
         """
-        for column, direction in order.items():
-            column = getattr(self.model_class, column)
-            match direction:
-                case "desc":
-                    query = query.order_by(column.desc())
-                case "asc":
-                    query = query.order_by(column)
+        columns = column_map(self.model_class)
+        clauses = [
+            ORDER_DIRECTIONS[direction](columns[column])
+            for column, direction in order.items()
+            if direction in ORDER_DIRECTIONS
+        ]
+        if clauses:
+            query = query.order_by(*clauses)
         return query
 
     def __apply_joins(self, query, joins):
@@ -286,48 +714,66 @@ class Dao(Generic[ModelType]):
         Returns:
             The query with the specified joins applied.
         """
-        if joins:
-            for join in joins:
-                if isinstance(join, list):
-                    # If join is a list, the first element is the join for the outer model
-                    # and the remaining elements are the joins for the inner model
-                    outer_join, *inner_joins = join
-                    relationship_attr = getattr(self.model_class, outer_join, None)
-                    if relationship_attr:
-                        # Apply the join for the outer model and the joins for the inner model
-                        query = query.options(
-                            apply_nested_joins(relationship_attr, inner_joins)
-                        )
-                else:
-                    # If join is a string, it's a join for the current model
-                    relationship_attr = getattr(self.model_class, join, None)
-                    if relationship_attr:
-                        query = query.options(joinedload(relationship_attr))
+        options = load_options(
+            self.model_class, freeze_joins(joins or ()), self.strict_loading
+        )
+        if options:
+            query = query.options(*options)
         return query
 
     def list(
         self,
-        filter: Dict = {},
-        order: Dict = {},
+        filter: Optional[Dict] = None,
+        order: Optional[Dict] = None,
         joins: Optional[List[str]] = None,
     ):
         """
         Retrieve a list of model instances based on filters, ordering, and joins.
 
         Args:
-            filter (Dict): Filters to apply to the query.
-            order (Dict): Ordering to apply to the query.
+            filter (Optional[Dict]): Filters to apply to the query.
+            order (Optional[Dict]): Ordering to apply to the query.
             joins (Optional[List[str]]): Optional list of relationships to join.
 
         Returns:
             A query object that can be further refined or executed.
         """
         query = select(self.model_class)
-        query = self.__apply_filter(query, filter)
+        query = self.__apply_filter(query, filter or {})
         query = self.__apply_joins(query, joins)
-        query = self.__apply_ordernation(query, order)
+        query = self.__apply_ordernation(query, order or {})
         return query
 
+    def list_raw(
+        self,
+        filter: Optional[Dict] = None,
+        order: Optional[Dict] = None,
+        columns: Optional[List[str]] = None,
+    ):
+        """
+        Retrieve plain rows of the model's table, without building model instances.
+
+        The rows skip ORM hydration (identity map, attribute state), which is
+        the bulk of the cost when reading thousands of rows only to serialize them.
+
+        Args:
+            filter (Optional[Dict]): Filters to apply to the query.
+            order (Optional[Dict]): Ordering to apply to the query.
+            columns (Optional[List[str]]): The columns to select. Defaults to every
+                column of the table.
+
+        Returns:
+            A list of row mappings, keyed by column name.
+        """
+        if columns:
+            mapped = column_map(self.model_class)
+            query = select(*[mapped[column] for column in columns])
+        else:
+            query = select(*self.model_class.__table__.columns)
+        query = self.__apply_filter(query, filter or {})
+        query = self.__apply_ordernation(query, order or {})
+        return self.db_session.execute(query).mappings().all()
+
     def update(self, by, value, obj_data: Dict[str, Any]) -> ModelType:
         """
         Update an existing instance of the model in the database.
@@ -348,23 +794,52 @@ class Dao(Generic[ModelType]):
             self.__populate_to_update(model, obj_data)
             return model
         except SQLAlchemyError as e:
-            if "1062" in str(e):
-                duplicate_values = (
-                    str(e)
-                    .split("Duplicate entry")[1]
-                    .split("for key")[0]
-                    .strip()
-                    .split("-")
-                )
-                column_details = (
-                    str(e).split("for key")[1].split("\n")[0].strip().split(".")
+            message = duplicate_entry_message(e)
+            if message is not None:
+                raise Exception(
+                    f"Error updating {self.model_class.__name__}. Duplicate entry: {message}."
                 )
-                columns = column_details[-1].split("_")[1:-1]
-                message_parts = [
-                    f"{col} = {val}" for col, val in zip(columns, duplicate_values)
-                ]
-                message = ", ".join(message_parts)
+            raise Exception(
+                f"{e} when updating the {self.model_class.__name__} in the database."
+            )
 
+    def update_bulk(self, by, value, obj_data: Dict[str, Any]) -> int:
+        """
+        Update every instance matching the selector with a single UPDATE.
+
+        The instances are not loaded first, so unlike `update` the UPDATE is
+        emitted even when the values are unchanged. None values are skipped.
+
+        Args:
+            by (str | List[str]): The column(s) to identify the instances to update.
+            value (Any | List[Any]): The value(s) to identify the instances to update.
+            obj_data (Dict[str, Any]): The new data to update the instances with.
+
+        Returns:
+            int: The number of instances matched.
+
+        Raises:
+            Exception: If there's an error during update, including duplicate entries.
+        """
+        values = {field: val for field, val in obj_data.items() if val is not None}
+        if not values:
+            return 0
+        values = self.__parse(values)
+        if "updated_at" in column_map(self.model_class):
+            values["updated_at"] = self.now
+        try:
+            query = (
+                update(self.model_class)
+                .where(self.__selector(by, value))
+                .values(**values)
+            )
+            result = self.db_session.exec(
+                query, execution_options={"synchronize_session": "evaluate"}
+            )
+            return result.rowcount
+        except SQLAlchemyError as e:
+            message = duplicate_entry_message(e)
+            if message is not None:
                 raise Exception(
                     f"Error updating {self.model_class.__name__}. Duplicate entry: {message}."
                 )
@@ -372,10 +847,94 @@ class Dao(Generic[ModelType]):
                 f"{e} when updating the {self.model_class.__name__} in the database."
             )
 
+    def __native_upsert(self, by, value, obj_data: Dict[str, Any]):
+        """
+        Insert or update an instance with one INSERT ... ON CONFLICT DO UPDATE
+        (PostgreSQL, SQLite 3.35+) or INSERT ... ON DUPLICATE KEY UPDATE (MySQL).
+
+        Only used when the statement picks the same row as looking it up first
+        would: `by` must be a single-column unique key of the table, `obj_data`
+        must hold `value` for it and every NOT NULL column, and on MySQL `by`
+        must be the table's only unique key. On a conflict the non-None values
+        are written and `updated_at` is set even if nothing else changed.
+
+        Args:
+            by (Optional[str]): The column to identify an existing instance.
+            value (Optional[Any]): The value to identify an existing instance.
+            obj_data (Dict[str, Any]): The data for the new or updated instance.
+
+        Returns:
+            The upserted instance, or None when the upsert can't be done this way.
+        """
+        dialect = self.db_session.get_bind().dialect
+        insert = UPSERT_INSERTS.get(dialect.name)
+        keys = unique_keys(self.model_class)
+        if (
+            insert is None
+            or not isinstance(by, str)
+            or (by,) not in keys
+            or value is None
+            or obj_data.get(by) != value
+        ):
+            return None
+        is_mysql = insert is mysql.insert
+        if is_mysql and len(keys) > 1:
+            # ON DUPLICATE KEY UPDATE would also fire on the other unique keys
+            return None
+        if not is_mysql and not dialect.insert_returning:
+            return None
+        table = self.model_class.__table__
+        if obj_data.keys() - table.columns.keys():
+            # Relationships and other non-column data need the ORM path
+            return None
+
+        model = self.__build(obj_data)
+        row = {}
+        for column in table.columns:
+            field = getattr(model, column.key)
+            if field is not None:
+                row[column.key] = field
+            elif not (
+                column.nullable
+                or column is table.autoincrement_column
+                or column.default is not None
+                or column.server_default is not None
+            ):
+                # The INSERT half would violate NOT NULL even on a conflict
+                return None
+        changes = [key for key, val in obj_data.items() if val is not None]
+        changes.remove(by)
+        if "updated_at" in row:
+            changes.append("updated_at")
+        if not changes:
+            return None
+
+        query = insert(self.model_class).values(**row)
+        if is_mysql:
+            query = query.on_duplicate_key_update(
+                **{key: query.inserted[key] for key in changes}
+            )
+            self.db_session.exec(query)
+            # MySQL has no RETURNING here; read the row back in the same transaction
+            query = select(self.model_class).where(self.__selector(by, value))
+            return self.db_session.exec(
+                query, execution_options={"populate_existing": True}
+            ).one()
+        query = query.on_conflict_do_update(
+            index_elements=[by], set_={key: query.excluded[key] for key in changes}
+        ).returning(self.model_class)
+        return self.db_session.scalars(
+            query, execution_options={"populate_existing": True}
+        ).one()
+
     def upsert(self, by: Optional[str], value: Optional[Any], obj_data):
         """
         Insert a new instance or update an existing one if it already exists.
 
+        Runs as a single native upsert statement when the database and the
+        selector allow it (see `__native_upsert`), otherwise looks the instance
+        up first and then inserts or updates it.
+
         Args:
             by (Optional[str]): The column to identify an existing instance.
             value (Optional[Any]): The value to identify an existing instance.
@@ -388,31 +947,18 @@ class Dao(Generic[ModelType]):
             Exception: If there's an error during upsert, including duplicate entries.
         """
         try:
+            model = self.__native_upsert(by, value, obj_data)
+            if model is not None:
+                return model
             model = self.get(by, value)
             if not model:
                 model = self.create(obj_data)
             else:
                 self.__populate_to_update(model, obj_data)
-                self.db_session.add(model)
             return model
         except SQLAlchemyError as e:
-            if "1062" in str(e):
-                duplicate_values = (
-                    str(e)
-                    .split("Duplicate entry")[1]
-                    .split("for key")[0]
-                    .strip()
-                    .split("-")
-                )
-                column_details = (
-                    str(e).split("for key")[1].split("\n")[0].strip().split(".")
-                )
-                columns = column_details[-1].split("_")[1:-1]
-                message_parts = [
-                    f"{col} = {val}" for col, val in zip(columns, duplicate_values)
-                ]
-                message = ", ".join(message_parts)
-
+            message = duplicate_entry_message(e)
+            if message is not None:
                 raise Exception(
                     f"Upsert {self.model_class.__name__} error. Duplicate entry: {message}."
                 )
@@ -421,39 +967,63 @@ class Dao(Generic[ModelType]):
             )
 
     def archive(self, by: str, value: Any):
-        try:
-            query = select(self.model_class)
+        """
+        Archive (soft delete) every instance matching the selector.
 
-            query = self.__apply_selector(query, by, value)
+        Runs as a single UPDATE, without loading the instances first.
 
-            records_to_archive = self.db_session.exec(query).all()
+        Args:
+            by (str | List[str]): The column(s) to identify the instances to archive.
+            value (Any | List[Any]): The value(s) to identify the instances to archive.
 
-            if not records_to_archive:
+        Raises:
+            Exception: If no instance matches or the UPDATE fails.
+        """
+        try:
+            values = {"archived": 1}
+            if "updated_at" in column_map(self.model_class):
+                values["updated_at"] = self.now
+            query = (
+                update(self.model_class)
+                .where(self.__selector(by, value))
+                .values(**values)
+            )
+            result = self.db_session.exec(
+                query, execution_options={"synchronize_session": "evaluate"}
+            )
+            if not result.rowcount:
                 raise NoResultFound(
                     f"No {self.model_class.__name__} found with {by} = {value}"
                 )
 
-            for record in records_to_archive:
-                record.archived = 1
-
         except SQLAlchemyError:
             raise Exception(
                 f"Error archiving {self.model_class.__name__} records by {by} = {value} in the database."
             )
 
     def delete(self, by: str, value: Any):
+        """
+        Delete every instance matching the selector.
+
+        Runs as a single DELETE, without loading the instances first.
+
+        Args:
+            by (str | List[str]): The column(s) to identify the instances to delete.
+            value (Any | List[Any]): The value(s) to identify the instances to delete.
+
+        Raises:
+            Exception: If no instance matches or the DELETE fails.
+        """
         try:
-            query = select(self.model_class)
-            query = self.__apply_selector(query, by, value)
-            records_to_delete = self.db_session.exec(query).all()
-            if not records_to_delete:
+            query = delete(self.model_class).where(self.__selector(by, value))
+            result = self.db_session.exec(
+                query, execution_options={"synchronize_session": "evaluate"}
+            )
+            if not result.rowcount:
                 raise NoResultFound(
                     f"No {self.model_class.__name__} found with {by} = {value}"
                 )
 
-            for record in records_to_delete:
-                self.db_session.delete(record)
-
         except SQLAlchemyError:
             raise Exception(
                 f"Error deleting {self.model_class.__name__} records by {by} = {value} in the database."
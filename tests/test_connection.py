@@ -0,0 +1,57 @@
+import pytest
+from sqlmodel_controller import connection
+from sqlmodel_controller.connection import get_db_config, get_engine
+
+
+@pytest.fixture()
+def sqlite_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_TYPE", "sqlite")
+    monkeypatch.setenv("DB_NAME", str(tmp_path / "test"))
+    get_db_config.cache_clear()
+    yield
+    get_db_config.cache_clear()
+    connection._create_engine.cache_clear()
+    connection._create_async_engine.cache_clear()
+
+
+def test_get_engine_is_shared(sqlite_env):
+    engine = get_engine()
+    assert get_engine() is engine
+    assert get_engine(pool_size=2) is not engine
+
+
+def test_pool_size_from_env(sqlite_env, monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "7")
+    engine = get_engine()
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 7
+    assert get_engine(pool_size=4).pool.size() == 4
+
+
+def test_get_async_engine(sqlite_env):
+    pytest.importorskip("greenlet")
+    pytest.importorskip("aiosqlite")
+    from sqlmodel_controller.connection import get_async_engine
+
+    engine = get_async_engine()
+    assert engine.url.drivername == "sqlite+aiosqlite"
+    assert get_async_engine() is engine
+
+
+def test_postgres_uses_psycopg(monkeypatch):
+    pytest.importorskip("psycopg")
+    monkeypatch.setenv("DB_TYPE", "postgres")
+    monkeypatch.setenv("DB_PORT", "5432")
+    get_db_config.cache_clear()
+    try:
+        assert get_engine().url.drivername == "postgresql+psycopg"
+    finally:
+        get_db_config.cache_clear()
+        connection._create_engine.cache_clear()
+
+
+def test_conn_uses_engine(sqlite_env):
+    from sqlmodel_controller import test_conn
+
+    assert test_conn() is True
@@ -1,8 +1,11 @@
 import pytest
 from datetime import date
+from enum import Enum
+from typing import Optional
+from sqlalchemy import Column, Integer, event, func
 from sqlmodel import SQLModel, create_engine, Field, Relationship
 from sqlmodel.pool import StaticPool
-from sqlmodel_controller import Controller, BaseID, BaseUUID
+from sqlmodel_controller import Controller, BaseID, BaseModel, BaseUUID
 
 
 class AddressModel(BaseID, table=True):
@@ -30,6 +33,35 @@ class UsersModel(BaseUUID, table=True):
     email: str
 
 
+class TicketStatus(Enum):
+    OPEN = 1
+    CLOSED = 2
+
+
+class TicketModel(BaseID, table=True):
+    __tablename__ = "tickets"
+
+    title: str
+    status: TicketStatus = Field(default=TicketStatus.OPEN)
+    due_date: Optional[date] = None
+
+
+class VersionedModel(BaseID, table=True):
+    __tablename__ = "versioned"
+
+    name: str
+    version: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, onupdate=func.abs(-9))
+    )
+
+
+class MembershipModel(BaseModel, table=True):
+    __tablename__ = "memberships"
+
+    group_id: int = Field(primary_key=True)
+    user_id: int = Field(primary_key=True)
+
+
 @pytest.fixture(name="engine")
 def engine_fixture():
     engine = create_engine(
@@ -41,6 +73,16 @@ def engine_fixture():
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture()
+def statements(engine):
+    """The SQL statements executed on `engine` during the test."""
+    captured = []
+    listener = lambda *args: captured.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield captured
+    event.remove(engine, "before_cursor_execute", listener)
+
+
 @pytest.fixture()
 def ctrl_person(engine):
     return Controller[PersonModel](engine=engine)
@@ -88,6 +130,39 @@ def test_upsert_person(ctrl_person):
     assert updated_person["birth_date"] == "2002-01-01"
 
 
+def test_upsert_by_primary_key_is_one_statement(ctrl_person, statements):
+    person_data = {
+        "id": 7,
+        "tax_id": "123456789",
+        "name": "Thiago Martin",
+        "birth_date": date(1990, 1, 1),
+        "nickname": "0xthiagomartins",
+    }
+    statements.clear()
+    assert ctrl_person.upsert(by="id", value=7, data=person_data) == 7
+    updated = ctrl_person.upsert(
+        by="id",
+        value=7,
+        data={**person_data, "name": "Thiago Martins"},
+        returns_object=True,
+    )
+
+    assert [statement.split()[0] for statement in statements] == ["INSERT", "INSERT"]
+    assert "ON CONFLICT" in statements[1]
+    assert updated["name"] == "Thiago Martins"
+    assert len(ctrl_person.list()) == 1
+
+    # Without every NOT NULL value the row is looked up and updated instead
+    ctrl_person.upsert(by="id", value=7, data={"id": 7, "nickname": "thiago"})
+    assert ctrl_person.get(by="id", value=7)["nickname"] == "thiago"
+
+    # Data that is not a table column, such as a relationship, also falls back
+    ctrl_person.upsert(
+        by="id", value=7, data={**person_data, "nickname": "0x", "addresses": []}
+    )
+    assert ctrl_person.get(by="id", value=7)["nickname"] == "0x"
+
+
 def test_update_person(ctrl_person):
     person_data = {
         "tax_id": "123456789",
@@ -102,6 +177,51 @@ def test_update_person(ctrl_person):
     assert updated_person["name"] == "Thiago Martins"
 
 
+def test_update_person_without_changes(ctrl_person, statements):
+    person_id = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    before = ctrl_person.get(by="id", value=person_id)
+
+    statements.clear()
+    ctrl_person.update(
+        by="id", value=person_id, data={"name": "Thiago Martin", "nickname": None}
+    )
+
+    assert not any(statement.startswith("UPDATE") for statement in statements)
+    assert ctrl_person.get(by="id", value=person_id) == before
+
+
+def test_update_bulk(ctrl_person, statements):
+    person_ids = [
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+        for i in range(3)
+    ]
+
+    statements.clear()
+    updated = ctrl_person.update_bulk(
+        by="birth_date", value=date(1990, 1, 1), data={"name": "Changed"}
+    )
+
+    assert updated == 3
+    assert len(statements) == 1 and statements[0].startswith("UPDATE")
+    for person_id in person_ids:
+        assert ctrl_person.get(by="id", value=person_id)["name"] == "Changed"
+    assert ctrl_person.update_bulk(by="id", value=-1, data={"name": "x"}) == 0
+
+
 def test_get_person(ctrl_person):
     person_data = {
         "tax_id": "123456789",
@@ -163,6 +283,30 @@ def test_delete_person(ctrl_person):
     assert deleted_person == {}
 
 
+def test_archive_and_delete_many_persons(ctrl_person):
+    for i in range(3):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": "Thiago Martin",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    with ctrl_person.unit_of_work():
+        # Instances already in the session see the bulk UPDATE
+        assert len(ctrl_person.list(filter={"name": "Thiago Martin"})) == 3
+        ctrl_person.archive(by="name", value="Thiago Martin")
+        persons = ctrl_person.list(filter={"name": "Thiago Martin"})
+        assert all(person["archived"] for person in persons)
+
+    ctrl_person.delete(by="name", value="Thiago Martin")
+    assert ctrl_person.list() == []
+    with pytest.raises(Exception):
+        ctrl_person.delete(by="name", value="Thiago Martin")
+
+
 def test_list_persons_with_order(ctrl_person):
     for i in range(5):
         ctrl_person.create(
@@ -214,6 +358,45 @@ def test_get_person_with_joins(ctrl_person, ctrl_address):
     assert person_with_address["addresses"][0]["street"] == "123 Main St"
 
 
+def test_many_to_one_join_uses_one_query(ctrl_person, ctrl_address, statements):
+    person_id = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    ctrl_address.create(
+        data={"street": "123 Main St", "city": "New York", "person_id": person_id}
+    )
+
+    statements.clear()
+    addresses = ctrl_address.list(joins=["person", ["person", "addresses"]])
+
+    assert addresses[0]["person"]["name"] == "Thiago Martin"
+    assert "JOIN persons" in statements[0]
+    assert len(statements) == 2
+
+
+def test_nested_joins_build_one_chain_per_inner_join():
+    from sqlmodel_controller.dao import apply_nested_joins
+
+    options = apply_nested_joins(
+        AddressModel.person, ["addresses", ["addresses", "person"]]
+    )
+
+    assert len(options) == 2
+    assert len(options[1].path) > len(options[0].path)
+
+
+def test_to_dict_skips_relationships_not_in_joins():
+    person = PersonModel(name="Thiago Martin", addresses=[])
+
+    assert "addresses" not in person.to_dict()
+    assert person.to_dict(joins=["addresses"])["addresses"] == []
+
+
 def test_list_persons_with_complex_filter(ctrl_person):
     for i in range(10):
         ctrl_person.create(
@@ -234,6 +417,56 @@ def test_list_persons_with_complex_filter(ctrl_person):
     assert all(1995 <= int(person["birth_date"][:4]) < 2000 for person in filtered_list)
     assert all("Person" in person["name"] for person in filtered_list)
 
+    in_list = ctrl_person.list(filter={"name": ["Person 1", "Person 3", "Nobody"]})
+    assert sorted(person["name"] for person in in_list) == ["Person 1", "Person 3"]
+
+
+def test_list_persons_raw(ctrl_person):
+    for i in range(3):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    rows = ctrl_person.list(raw=True, order={"name": "desc"})
+    assert [row["name"] for row in rows] == ["Person 2", "Person 1", "Person 0"]
+    assert rows[0]["birth_date"] == date(1990, 1, 1)
+
+    rows = ctrl_person.list(
+        raw=True, columns=["id", "name"], filter={"name": "Person 1"}
+    )
+    assert list(rows[0]) == ["id", "name"]
+
+    with pytest.raises(ValueError):
+        ctrl_person.list(raw=True, mode="paginated")
+
+
+def test_list_persons_with_negated_and_list_filters(ctrl_person):
+    for i in range(4):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    filtered_list = ctrl_person.list(
+        filter={
+            "name": {"not-contains": "3", "like": "Person%"},
+            "nickname": ["person1", "person2", "person3"],
+        }
+    )
+    assert sorted(person["name"] for person in filtered_list) == [
+        "Person 1",
+        "Person 2",
+    ]
+
 
 def test_list_persons_with_pagination_and_order(ctrl_person):
     for i in range(20):
@@ -265,6 +498,84 @@ def test_returns_object(ctrl_person):
     }
     person: dict = ctrl_person.create(data=payload, returns_object=True)
     assert person.get("name") == payload.get("name")
+    assert person["created_at"] == person["updated_at"]
+    assert person == ctrl_person.get(by="id", value=person["id"])
+
+
+def test_create_returns_object_without_select(ctrl_person, statements):
+    statements.clear()
+    person = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martins",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        },
+        returns_object=True,
+    )
+
+    assert not any(statement.startswith("SELECT") for statement in statements)
+    assert person["archived"] is False
+
+
+def test_update_returns_object_without_refresh(ctrl_person, statements):
+    person_id = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    statements.clear()
+    person = ctrl_person.update(
+        by="id", value=person_id, data={"name": "Thiago Martins"}, returns_object=True
+    )
+
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE"]
+    assert person == ctrl_person.get(by="id", value=person_id)
+
+
+def test_create_returns_object_with_enum_name_and_iso_date(engine):
+    ctrl_ticket = Controller[TicketModel](engine=engine)
+    ticket = ctrl_ticket.create(
+        data={"title": "Ticket", "status": "CLOSED", "due_date": "2024-05-01"},
+        returns_object=True,
+    )
+    assert ticket["status"] == "CLOSED"
+    assert ticket["due_date"] == "2024-05-01"
+
+    stored = ctrl_ticket.get(by="id", value=ticket["id"])
+    assert stored["status"] == "CLOSED"
+    assert stored["due_date"] == "2024-05-01"
+
+
+def test_update_returns_object_with_enum_name_and_iso_date(engine):
+    ctrl_ticket = Controller[TicketModel](engine=engine)
+    ticket_id = ctrl_ticket.create(data={"title": "Ticket"})
+    ticket = ctrl_ticket.update(
+        by="id",
+        value=ticket_id,
+        data={"status": "CLOSED", "due_date": "2024-05-01"},
+        returns_object=True,
+    )
+    assert ticket["status"] == "CLOSED"
+    assert ticket["due_date"] == "2024-05-01"
+
+    stored = ctrl_ticket.get(by="id", value=ticket_id)
+    assert stored["status"] == "CLOSED"
+    assert stored["due_date"] == "2024-05-01"
+
+
+def test_update_returns_object_with_onupdate_expression(engine):
+    ctrl_versioned = Controller[VersionedModel](engine=engine)
+    versioned_id = ctrl_versioned.create(data={"name": "first"})
+    versioned = ctrl_versioned.update(
+        by="id", value=versioned_id, data={"name": "second"}, returns_object=True
+    )
+    assert versioned["name"] == "second"
+    assert versioned["version"] == 9
+    assert ctrl_versioned.get(by="id", value=versioned_id)["version"] == 9
 
 
 def test_paginate_invalid_current_page(ctrl_person):
@@ -289,3 +600,564 @@ def test_uuid(ctrl_user):
     import uuid
 
     assert isinstance(uuid.UUID(str(user_id)), uuid.UUID)
+
+
+def test_get_reuses_cached_statement(ctrl_person):
+    from sqlmodel_controller.dao import compiled_get
+
+    Controller.clear_statement_cache()
+    person_id = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    ctrl_person.get(by="name", value="Thiago Martin")
+    ctrl_person.get(by="name", value="Someone Else")
+    assert compiled_get.cache_info().hits >= 1
+
+    Controller.clear_statement_cache()
+    assert compiled_get.cache_info().currsize == 0
+    assert ctrl_person.get(by="id", value=person_id)["name"] == "Thiago Martin"
+
+
+def test_get_by_primary_key_uses_identity_map(ctrl_person, statements):
+    with ctrl_person:
+        dao = ctrl_person.Dao(ctrl_person.session, PersonModel)
+        person = dao.create(
+            {
+                "tax_id": "123456789",
+                "name": "Thiago Martin",
+                "birth_date": date(1990, 1, 1),
+                "nickname": "0xthiagomartins",
+            }
+        )
+        ctrl_person.session.flush()
+        statements.clear()
+        assert dao.get(by="id", value=person.id) is person
+        assert statements == []
+
+    assert ctrl_person.get(by="id", value=-1) == {}
+
+
+def test_unit_of_work_shares_session(ctrl_person):
+    with ctrl_person.unit_of_work() as session:
+        person_id = ctrl_person.create(
+            data={
+                "tax_id": "123456789",
+                "name": "Thiago Martin",
+                "birth_date": date(1990, 1, 1),
+                "nickname": "0xthiagomartins",
+            }
+        )
+        ctrl_person.update(by="id", value=person_id, data={"name": "Thiago Martins"})
+        assert ctrl_person.session is session
+
+    assert ctrl_person.session is None
+    assert ctrl_person.get(by="id", value=person_id)["name"] == "Thiago Martins"
+
+
+def test_result_cache(engine, ctrl_person):
+    from sqlalchemy import text
+
+    cached = Controller[PersonModel](engine=engine, result_cache_ttl=60)
+    person_id = cached.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    assert cached.get(by="id", value=person_id)["name"] == "Thiago Martin"
+    assert len(cached.list(filter={"name": "Thiago Martin"})) == 1
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE persons SET name = 'Changed'"))
+    assert cached.get(by="id", value=person_id)["name"] == "Thiago Martin"
+    assert len(cached.list(filter={"name": "Thiago Martin"})) == 1
+
+    # Writes through any controller of the model drop the cached results
+    ctrl_person.update(by="id", value=person_id, data={"nickname": "thiago"})
+    assert cached.get(by="id", value=person_id)["name"] == "Changed"
+    assert cached.list(filter={"name": "Thiago Martin"}) == []
+
+
+def test_result_cache_skips_results_loaded_during_a_write(engine):
+    from sqlmodel_controller.controller import invalidate_results
+
+    cached = Controller[PersonModel](engine=engine, result_cache_ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        if len(calls) == 1:
+            invalidate_results(PersonModel)
+        return len(calls)
+
+    assert cached._cached(("key",), load) == 1
+    assert cached._cached(("key",), load) == 2
+    assert cached._cached(("key",), load) == 2
+
+
+def test_unit_of_work_rolls_back_every_operation(ctrl_person):
+    with pytest.raises(RuntimeError):
+        with ctrl_person.unit_of_work():
+            person_id = ctrl_person.create(
+                data={
+                    "tax_id": "123456789",
+                    "name": "Thiago Martin",
+                    "birth_date": date(1990, 1, 1),
+                    "nickname": "0xthiagomartins",
+                }
+            )
+            assert person_id is not None
+            raise RuntimeError("abort")
+
+    assert ctrl_person.get(by="id", value=person_id) == {}
+
+
+def test_unit_of_work_shared_across_controllers(ctrl_person, ctrl_address):
+    with ctrl_person.unit_of_work() as session:
+        person_id = ctrl_person.create(
+            data={
+                "tax_id": "123456789",
+                "name": "Thiago Martin",
+                "birth_date": date(1990, 1, 1),
+                "nickname": "0xthiagomartins",
+            }
+        )
+        with ctrl_address:
+            assert ctrl_address.session is session
+            ctrl_address.create(
+                data={"street": "Main St", "city": "Springfield", "person_id": person_id}
+            )
+
+    assert ctrl_address.session is None
+    assert ctrl_address.get(by="person_id", value=person_id)["city"] == "Springfield"
+
+
+def test_paginate_count_cache(engine, ctrl_person):
+    from sqlalchemy import text
+
+    for i in range(3):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    first = ctrl_person.list(mode="paginated", per_page=2, count_cache_ttl=60)
+    assert first["total_data"] == 3
+
+    ctrl_person.create(
+        data={
+            "tax_id": "123456783",
+            "name": "Person 3",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "person3",
+        }
+    )
+    # Writes through the controllers drop the cached totals of their table
+    refreshed = ctrl_person.list(mode="paginated", per_page=2, count_cache_ttl=60)
+    assert refreshed["total_data"] == 4
+
+    with ctrl_person.engine.begin() as conn:
+        conn.execute(text("DELETE FROM persons WHERE nickname = 'person3'"))
+    cached = ctrl_person.list(mode="paginated", per_page=2, count_cache_ttl=60)
+    assert cached["total_data"] == 4
+    # The cached totals are shared by every controller on the same engine
+    other = Controller[PersonModel](engine=engine)
+    cached = other.list(mode="paginated", per_page=2, count_cache_ttl=60)
+    assert cached["total_data"] == 4
+    fresh = ctrl_person.list(mode="paginated", per_page=2)
+    assert fresh["total_data"] == 3
+
+
+def test_strict_loading_raises_on_lazy_relationship(engine, ctrl_person, ctrl_address):
+    person_id = ctrl_person.create(
+        data={
+            "tax_id": "123456789",
+            "name": "Thiago Martin",
+            "birth_date": date(1990, 1, 1),
+            "nickname": "0xthiagomartins",
+        }
+    )
+    ctrl_address.create(
+        data={"street": "123 Main St", "city": "New York", "person_id": person_id}
+    )
+
+    strict = Controller[PersonModel](engine=engine, strict_loading=True)
+    persons = strict.list(joins=["addresses"])
+    assert persons[0]["addresses"][0]["street"] == "123 Main St"
+
+    from sqlalchemy.exc import InvalidRequestError
+
+    with strict:
+        dao = strict.Dao(strict.session, PersonModel, strict_loading=True)
+        person = dao.get(by="name", value="Thiago Martin")
+        with pytest.raises(InvalidRequestError):
+            person.addresses
+
+
+def test_strict_loading_defaults_to_env(engine, monkeypatch):
+    from sqlmodel_controller import controller
+
+    monkeypatch.setattr(controller, "STRICT_LOADING", True)
+    assert Controller[PersonModel](engine=engine).strict_loading is True
+    lenient = Controller[PersonModel](engine=engine, strict_loading=False)
+    assert lenient.strict_loading is False
+
+
+def test_list_persons_stream(ctrl_person):
+    for i in range(5):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    stream = ctrl_person.list(mode="stream", batch_size=2, order={"name": "asc"})
+    assert not isinstance(stream, list)
+    persons = list(stream)
+    assert [person["name"] for person in persons] == [f"Person {i}" for i in range(5)]
+    assert ctrl_person.session is None
+
+
+def test_page_create():
+    from sqlmodel_controller.controller import Page
+
+    page = Page.create(data_set=[1, 2], page=2, page_size=2, total=5)
+    assert page.previous_page == 1
+    assert page.next_page == 3
+    assert page.has_previous and page.has_next
+    assert page.pages == 3
+
+    last = Page.create(data_set=[5], page=3, page_size=2, total=5)
+    assert last.next_page is None
+    assert not last.has_next
+
+    uncounted = Page.create(
+        data_set=[1, 2], page=1, page_size=2, total=None, has_next=True
+    )
+    assert uncounted.next_page == 2
+    assert uncounted.pages is None
+
+    assert last.to_dict() == {
+        "data_set": [5],
+        "previous_page": 2,
+        "next_page": None,
+        "has_previous": True,
+        "has_next": False,
+        "total": 5,
+        "pages": 3,
+    }
+
+
+def test_paginate_without_total(ctrl_person):
+    for i in range(5):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    page = ctrl_person.list(mode="paginated", page=2, per_page=2, include_total=False)
+    assert page["total_data"] is None
+    assert page["total_pages"] is None
+    assert page["next"] == 3
+    assert len(page["data_set"]) == 2
+
+    last = ctrl_person.list(mode="paginated", page=3, per_page=2, include_total=False)
+    assert last["next"] is None
+    assert len(last["data_set"]) == 1
+
+
+def test_create_and_update_many(ctrl_person):
+    person_ids = ctrl_person.create_many(
+        data=[
+            {
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+            for i in range(5)
+        ],
+        batch_size=2,
+    )
+    assert len(person_ids) == 5
+    assert len(set(person_ids)) == 5
+
+    ctrl_person.update_many(
+        data=[{"id": person_id, "nickname": "renamed"} for person_id in person_ids[:3]]
+    )
+    persons = ctrl_person.list(order={"id": "asc"})
+    assert [person["nickname"] for person in persons] == ["renamed"] * 3 + [
+        "person3",
+        "person4",
+    ]
+
+    # None values are skipped like in update, and a row left with only its
+    # primary key is not updated at all
+    ctrl_person.update_many(
+        data=[
+            {"id": person_ids[0], "name": "Renamed", "nickname": None},
+            {"id": person_ids[1], "nickname": None},
+        ]
+    )
+    persons = ctrl_person.list(order={"id": "asc"})
+    assert persons[0]["name"] == "Renamed"
+    assert [person["nickname"] for person in persons[:2]] == ["renamed"] * 2
+
+
+def test_get_many_persons(ctrl_person):
+    person_ids = [
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+        for i in range(3)
+    ]
+
+    persons = ctrl_person.get_many(by="id", values=[person_ids[0], person_ids[2], -1])
+    assert set(persons) == {person_ids[0], person_ids[2]}
+    assert persons[person_ids[2]]["name"] == "Person 2"
+
+
+def test_list_persons_seek(ctrl_person):
+    for i in range(5):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    names = []
+    page = ctrl_person.list(mode="seek", per_page=2)
+    names += [person["name"] for person in page["data_set"]]
+    while page["next_cursor"] is not None:
+        page = ctrl_person.list(mode="seek", per_page=2, cursor=page["next_cursor"])
+        names += [person["name"] for person in page["data_set"]]
+    assert names == [f"Person {i}" for i in range(5)]
+
+    page = ctrl_person.list(
+        mode="seek", per_page=3, cursor_column="tax_id", direction="desc"
+    )
+    assert page["has_next"] is True
+    assert [person["name"] for person in page["data_set"]] == [
+        "Person 4",
+        "Person 3",
+        "Person 2",
+    ]
+    page = ctrl_person.list(
+        mode="paginated",
+        per_page=3,
+        cursor=page["next_cursor"],
+        cursor_column="tax_id",
+        direction="desc",
+    )
+    assert page["has_next"] is False
+    assert page["next_cursor"] is None
+    assert [person["name"] for person in page["data_set"]] == ["Person 1", "Person 0"]
+
+    # Every person shares a birth date, so the primary key breaks the ties
+    names = []
+    cursor = None
+    while True:
+        page = ctrl_person.list(
+            mode="seek", per_page=2, cursor=cursor, cursor_column=["birth_date", "id"]
+        )
+        names += [person["name"] for person in page["data_set"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert names == [f"Person {i}" for i in range(5)]
+
+
+def test_paginate_window_count(engine, ctrl_person):
+    from sqlmodel_controller.controller import window_count_supported
+
+    with engine.connect():
+        assert window_count_supported(engine.dialect)
+    for i in range(7):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    page = ctrl_person.list(mode="paginated", page=3, per_page=3, order={"name": "asc"})
+    assert page["total_data"] == 7
+    assert page["total_pages"] == 3
+    assert [person["name"] for person in page["data_set"]] == ["Person 6"]
+
+    beyond = ctrl_person.list(mode="paginated", page=4, per_page=3)
+    assert beyond["total_data"] == 7
+    assert beyond["data_set"] == []
+
+
+def test_paginate_estimate_falls_back_to_exact_count(engine, ctrl_person):
+    from sqlmodel import Session, select
+    from sqlmodel_controller.controller import estimate_total
+
+    for i in range(3):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    with Session(engine) as session:
+        assert estimate_total(select(PersonModel), session) is None
+
+    page = ctrl_person.list(mode="paginated", per_page=2, include_total="estimate")
+    assert page["total_data"] == 3
+    assert page["next"] == 2
+
+
+def test_paginate_returns_page(engine, ctrl_person):
+    from sqlmodel import Session, select
+    from sqlmodel_controller.controller import Page, paginate
+
+    for i in range(3):
+        ctrl_person.create(
+            data={
+                "tax_id": f"12345678{i}",
+                "name": f"Person {i}",
+                "birth_date": date(1990, 1, 1),
+                "nickname": f"person{i}",
+            }
+        )
+
+    with Session(engine) as session:
+        page = paginate(
+            select(PersonModel), session, current_page=1, per_page=2, to_dict=False
+        )
+    assert isinstance(page, Page)
+    assert len(page.data_set) == 2
+    assert page.next_page == 2
+    assert page.total == 3
+    assert page.pages == 2
+
+
+def test_duplicate_entry_message():
+    from sqlalchemy.exc import IntegrityError, OperationalError
+    from sqlmodel_controller.dao import duplicate_entry_message
+
+    class MySQLError(Exception):
+        errno = 1062
+
+    class PostgresError(Exception):
+        sqlstate = "23505"
+
+    error = IntegrityError(
+        "INSERT",
+        {},
+        MySQLError("Duplicate entry 'John-NYC' for key 'persons.uq_name_city_idx'"),
+    )
+    assert duplicate_entry_message(error) == "name = John, city = NYC"
+
+    error = IntegrityError(
+        "INSERT",
+        {},
+        PostgresError("Key (name, city)=(John, NYC) already exists."),
+    )
+    assert duplicate_entry_message(error) == "name = John, city = NYC"
+
+    fields = {"C": "23505", "D": "Key (name)=(John) already exists."}
+    error = IntegrityError("INSERT", {}, PostgresError(fields))
+    assert duplicate_entry_message(error) == "name = John"
+
+    error = OperationalError("INSERT", {}, MySQLError("Duplicate entry 'x' for key"))
+    assert duplicate_entry_message(error) is None
+    assert duplicate_entry_message(Exception("connection lost")) is None
+
+
+def test_async_controller(tmp_path):
+    import asyncio
+
+    pytest.importorskip("greenlet")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel_controller.async_controller import AsyncController
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        ctrl = AsyncController[PersonModel](engine=engine)
+
+        person_ids = await asyncio.gather(
+            *[
+                ctrl.create(
+                    data={
+                        "tax_id": f"12345678{i}",
+                        "name": f"Person {i}",
+                        "birth_date": date(1990, 1, 1),
+                        "nickname": f"person{i}",
+                    }
+                )
+                for i in range(3)
+            ]
+        )
+        await ctrl.update(by="id", value=person_ids[0], data={"name": "Changed"})
+        person = await ctrl.get(by="id", value=person_ids[0])
+        persons = await ctrl.list(order={"id": "asc"})
+        await ctrl.delete(by="id", value=person_ids[1])
+        remaining = await ctrl.list(mode="paginated", per_page=10)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await engine.dispose()
+        return person, persons, remaining
+
+    person, persons, remaining = asyncio.run(scenario())
+    assert person["name"] == "Changed"
+    assert len(persons) == 3
+    assert remaining["total_data"] == 2
+
+
+def test_list_seek_composite_primary_key(engine):
+    from sqlmodel import Session
+
+    with Session(engine) as session:
+        session.add_all(
+            MembershipModel(group_id=group_id, user_id=user_id)
+            for group_id in (1, 2)
+            for user_id in (1, 2, 3)
+        )
+        session.commit()
+
+    ctrl_membership = Controller[MembershipModel](engine=engine)
+    keys = []
+    page = ctrl_membership.list(mode="seek", per_page=2)
+    keys += [(row["group_id"], row["user_id"]) for row in page["data_set"]]
+    while page["next_cursor"] is not None:
+        page = ctrl_membership.list(mode="seek", per_page=2, cursor=page["next_cursor"])
+        keys += [(row["group_id"], row["user_id"]) for row in page["data_set"]]
+    assert keys == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3)]
@@ -67,3 +67,52 @@ def test_base_id():
 def test_inheritance():
     assert issubclass(BaseArchived, BaseModel)
     assert issubclass(BaseID, BaseArchived)
+
+
+def test_make_serializer_matches_to_dict():
+    from sqlmodel_controller.model import make_serializer
+
+    model = TestBaseModel(test_list=[TestEnum.VALUE2])
+    serializer = make_serializer(TestBaseModel)
+    assert serializer(model) == model.to_dict()
+    assert serializer(model)["test_list"] == ["VALUE2"]
+    assert make_serializer(TestBaseModel) is serializer
+
+
+def test_make_serializer_typed_enum_list():
+    from typing import Optional
+    from sqlmodel_controller.model import _field_kind, make_serializer
+
+    class EnumListModel(BaseModel):
+        tags: list[TestEnum] = Field(default_factory=list)
+
+    assert _field_kind(list[TestEnum]) == "enum_list"
+    assert _field_kind(Optional[list[TestEnum]]) == "enum_list"
+    assert _field_kind(list[str]) == "generic"
+    model = EnumListModel(tags=[TestEnum.VALUE1, TestEnum.VALUE2])
+    assert make_serializer(EnumListModel)(model)["tags"] == ["VALUE1", "VALUE2"]
+
+
+def test_to_dict_keeps_unvalidated_values():
+    # Table models store what they are given without validating it
+    model = TestBaseModel()
+    model.test_enum = "VALUE2"
+    model.test_date = "1990-01-01"
+    model_dict = model.to_dict()
+
+    assert model_dict["test_enum"] == "VALUE2"
+    assert model_dict["test_date"] == "1990-01-01"
+
+
+def test_to_json_matches_to_dict(monkeypatch):
+    import json
+    from sqlmodel_controller import model as model_module
+
+    model = TestBaseModel(test_list=[TestEnum.VALUE2])
+    keyed = {1: model.to_dict()}
+    assert json.loads(model.to_json()) == model.to_dict()
+    assert json.loads(model_module.dumps(keyed)) == {"1": model.to_dict()}
+
+    monkeypatch.setattr(model_module, "orjson", None)
+    assert json.loads(model.to_json()) == model.to_dict()
+    assert json.loads(model_module.dumps(keyed)) == {"1": model.to_dict()}